@@ -1,66 +1,9 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
 import math
 
-# Definición de la clase AFD
-class AFD:
-    def __init__(self): # Constructor de la clase AFD 
-        self.estado_inicial = None # Inicializa el estado inicial en None 
-        self.estados_finales = set() # Inicializa el conjunto de estados finales como un conjunto vacío 
-        self.transiciones = {} # Inicializa el diccionario de transiciones como un diccionario vacío 
-        self.todos_los_estados = set() # Inicializa el conjunto de todos los estados como un conjunto vacío 
-
-    def configurar_estado_inicial(self, estado): # Método para configurar el estado inicial 
-        if estado in self.todos_los_estados: # Verifica que el estado ingresado esté en el conjunto de todos los estados 
-            self.estado_inicial = estado # Asigna el estado ingresado como estado inicial 
-        else:
-            raise ValueError("El estado inicial debe ser uno de los estados definidos en las transiciones.")
-
-    def agregar_transicion(self, estado_origen, simbolo, estado_destino): # Método para agregar una transición 
-        if estado_origen not in self.transiciones: # Verifica si el estado origen no está en el diccionario de transiciones 
-            self.transiciones[estado_origen] = {} # Crea un diccionario vacío para el estado origen 
-        elif simbolo in self.transiciones[estado_origen]: # Verifica si ya existe una transición con el mismo símbolo 
-            raise ValueError(f"Transición no determinista detectada: desde {estado_origen} ya existe una transición con el símbolo {simbolo}.") # Muestra un mensaje de error si ya existe una transición con el mismo símbolo 
-        self.transiciones[estado_origen][simbolo] = estado_destino # Asigna el estado destino al estado origen con el símbolo correspondiente 
-        self.todos_los_estados.update([estado_origen, estado_destino]) # Actualiza el conjunto de todos los estados con los estados involucrados en la transición 
-
-    
-    def eliminar_transicion(self, estado_origen, simbolo): # Método para eliminar una transición 
-        if estado_origen in self.transiciones and simbolo in self.transiciones[estado_origen]: # Verifica si el estado origen y el símbolo existen en el diccionario de transiciones 
-            del self.transiciones[estado_origen][simbolo] # Elimina la transición del diccionario de transiciones 
-            if not self.transiciones[estado_origen]: # Verifica si el estado origen no tiene más transiciones 
-                del self.transiciones[estado_origen] # Elimina el estado origen del diccionario de transiciones 
-    
-    def eliminar_estado_si_es_huerfano(self, estado):
-        # Un estado huerfano es aquel que no tiene transiciones entrantes ni salientes
-        if estado not in self.transiciones and all(estado != destino for trans in self.transiciones.values() for destino in trans.values()): # Verifica si el estado no está en el diccionario de transiciones y si no es un estado destino en ninguna transición 
-            self.todos_los_estados.discard(estado) # Elimina el estado del conjunto de todos los estados 
-            self.estados_finales.discard(estado) # Elimina el estado del conjunto de estados finales 
-            if self.estado_inicial == estado: # Verifica si el estado es el estado inicial 
-                self.estado_inicial = None # Asigna None al estado inicial 
-        
-    def agregar_estado_final(self, estado): # Método para agregar un estado final 
-        if estado in self.todos_los_estados: # Verifica si el estado está en el conjunto de todos los estados 
-            self.estados_finales.add(estado) # Agrega el estado al conjunto de estados finales 
-        else:
-            raise ValueError("Los estados finales deben ser uno de los estados definidos en las transiciones.")
-        
-    def aceptar(self, cadena): # Método para verificar si una cadena es aceptada por el AFD 
-        estado_actual = self.estado_inicial # Inicializa el estado actual con el estado inicial 
-        for simbolo in cadena: # Itera sobre cada símbolo de la cadena 
-            estado_actual = self.transiciones.get(estado_actual, {}).get(simbolo) # Obtiene el estado destino de la transición actual 
-            if estado_actual is None: # Verifica si el estado actual es None 
-                return False # Retorna False si no hay transición para el símbolo actual
-        return estado_actual in self.estados_finales # Retorna True si el estado actual es un estado final, False en caso contrario 
-    
-    def obtener_datos_visuales(self):
-        # Esta función retorna una estructura de datos con la información necesaria para dibujar el AFD
-        return {
-            'estados': self.todos_los_estados,
-            'transiciones': self.transiciones,
-            'estado_inicial': self.estado_inicial, 
-            'estados_finales': self.estados_finales
-        }
+from automatas import AFD
+from expresiones_regulares import compilar_expresion
 
 def agregar_transicion(): # Función para agregar una transición 
     estado_origen = entry_estado_origen.get() # Obtiene el estado origen ingresado en el campo de entrada 
@@ -73,11 +16,13 @@ def agregar_transicion(): # Función para agregar una transición
             entry_estado_origen.delete(0, tk.END) # Limpia el campo de entrada del estado origen 
             entry_simbolo.delete(0, tk.END) # Limpia el campo de entrada del símbolo 
             entry_estado_destino.delete(0, tk.END) # Limpia el campo de entrada del estado destino 
+            sincronizar_estado(estado_origen) # Actualiza solo los elementos afectados del canvas
+            sincronizar_estado(estado_destino)
+            sincronizar_arista(estado_origen, estado_destino)
         except ValueError as ve: 
             messagebox.showerror("Error de transición", str(ve)) # Muestra un mensaje de error si la transición no se puede agregar 
     else:
         messagebox.showwarning("Advertencia", "Todos los campos deben estar completos.") # Muestra un mensaje de advertencia si no se completan todos los campos
-    actualizar_visualizacion() # Actualiza la visualización del AFD 
 
 def eliminar_transicion(): # Función para eliminar una transición
     seleccion = listbox_transiciones.curselection() # Obtiene la selección actual en la lista de transiciones
@@ -87,16 +32,13 @@ def eliminar_transicion(): # Función para eliminar una transición
         estado_origen, resto = contenido.strip().split(' -- ') # Divide el contenido en el estado origen y el resto de la transición
         simbolo, estado_destino = resto.split(' --> ') # Divide el resto de la transición en el símbolo y el estado destino 
         simbolo = simbolo.strip() # Elimina los espacios en blanco del símbolo
-        print("eliminando transicion de ", estado_origen, "con simbolo ", simbolo, "y destino ", estado_destino)
         afd.eliminar_transicion(estado_origen, simbolo) # Elimina la transición del AFD 
         afd.eliminar_estado_si_es_huerfano(estado_origen) # Elimina el estado origen si es un estado huérfano 
         afd.eliminar_estado_si_es_huerfano(estado_destino) # Elimina el estado destino si es un estado huérfano 
         listbox_transiciones.delete(indice) # Elimina la transición de la lista de transiciones
-        print("Estado del AFD después de eliminar:")
-        print("Transiciones:", afd.transiciones)
-        print("Estados:", afd.todos_los_estados)
-        print("Estados finales:", afd.estados_finales)
-        actualizar_visualizacion() # Actualiza la visualización del AFD 
+        sincronizar_arista(estado_origen, estado_destino) # Actualiza solo los elementos afectados del canvas
+        sincronizar_estado(estado_origen)
+        sincronizar_estado(estado_destino)
     else:
         messagebox.showwarning("Advertencia", "Seleccione una transición para eliminar.")
 
@@ -108,9 +50,10 @@ def configurar_estados(): # Función para configurar los estados iniciales y fin
         messagebox.showwarning("Advertencia", "Debe ingresar tanto el estado inicial como al menos un estado final.") # Muestra un mensaje de advertencia si no se ingresan los estados necesarios
         return
 
+    anteriores = afd.estados_finales | {afd.estado_inicial} # Estados cuyo dibujo puede cambiar
     try:
         afd.configurar_estado_inicial(estado_inicial)
-        afd.estados_finales.clear()  # Limpiar estados finales antes de agregar nuevos
+        afd.limpiar_estados_finales()  # Limpiar estados finales antes de agregar nuevos
         for estado_final in estados_finales: # Agregar cada estado final a los estados finales del AFD 
             afd.agregar_estado_final(estado_final.strip()) # Agrega el estado final al AFD 
         label_estado_actual.config(text=f"Estado inicial: {estado_inicial}, Estados finales: {estados_finales}") # Actualiza la etiqueta de estado actual 
@@ -118,7 +61,9 @@ def configurar_estados(): # Función para configurar los estados iniciales y fin
         entry_estados_finales.delete(0, tk.END) # Limpia el campo de entrada de los estados finales 
     except ValueError as e: # Captura cualquier error que ocurra al configurar los estados 
         messagebox.showerror("Error", str(e)) # Muestra un mensaje de error si ocurre un error al configurar los estados 
-    actualizar_visualizacion() # Actualiza la visualización del AFD 
+    for estado in anteriores | afd.estados_finales | {afd.estado_inicial}: # Redibuja solo los estados que pudieron cambiar
+        if estado is not None:
+            sincronizar_estado(estado)
 
 def simular_cadena(): # Función para simular una cadena en el AFD 
     cadena = entry_cadena.get() # Obtiene la cadena ingresada en el campo de entrada
@@ -130,47 +75,192 @@ def simular_cadena(): # Función para simular una cadena en el AFD
         messagebox.showwarning("Advertencia", "Debe configurar el estado inicial y los estados finales antes de simular.") # Muestra un mensaje de advertencia si no se han configurado los estados necesarios
         return # Retorna para salir de la función
 
-    es_aceptada = afd.aceptar(cadena) # Verifica si la cadena es aceptada por el AFD
-    if es_aceptada: # Verifica si la cadena es aceptada
+    traza = afd.trazar(cadena) # Recorre la cadena una sola vez guardando todos los estados visitados
+    if traza.aceptada: # Verifica si la cadena es aceptada
         messagebox.showinfo("Resultado", f"La palabra '{cadena}' es ACEPTADA por el AFD.") 
     else:
         messagebox.showinfo("Resultado", f"La palabra '{cadena}' NO es aceptada por el AFD.")
     entry_cadena.delete(0, tk.END)
+    iniciar_traza(traza) # Anima el recorrido sobre el canvas
+
+# Reproducción de la traza: se resalta el estado y la transición de cada paso usando root.after para no bloquear la interfaz
+DEMORA_ANIMACION = 400 # Milisegundos entre pasos de la animación
+COLOR_RESALTADO = '#FFD700' # Color del estado y la transición del paso actual
+traza_actual = None # Traza que se está reproduciendo
+paso_actual = 0 # Paso de la traza que está resaltado
+animacion = None # Identificador del próximo paso programado con root.after
+
+def iniciar_traza(traza): # Función que prepara los controles para recorrer la traza y empieza la animación
+    global traza_actual
+    detener_traza()
+    traza_actual = traza
+    barra_traza.configure(to=len(traza) - 1) # Un valor de la barra por cada paso
+    barra_traza.set(0)
+    mostrar_paso(0)
+    reproducir_pausar()
+
+def detener_traza(): # Función que detiene la animación y quita el resaltado
+    global traza_actual, animacion
+    if animacion is not None:
+        root.after_cancel(animacion)
+        animacion = None
+    traza_actual = None
+    canvas.delete("resaltado")
+    button_reproducir.config(text="Reproducir")
+    label_traza.config(text="")
+
+def mostrar_paso(paso): # Función que resalta el estado y la transición de un paso de la traza
+    global paso_actual
+    paso_actual = paso
+    canvas.delete("resaltado") # Quita el resaltado del paso anterior
+    estado = traza_actual.estado(paso)
+    transicion = traza_actual.transicion(paso)
+    if estado in posiciones and not _es_visible(estado): # Lleva la vista hasta el estado si está fuera de ella
+        centrar_en(estado)
+    if transicion is not None and transicion[0] in posiciones and transicion[2] in posiciones:
+        origen, simbolo, destino = transicion
+        x1, y1 = posiciones[origen]
+        x2, y2 = posiciones[destino]
+        dibujar_transicion(canvas, x1 * escala, y1 * escala, x2 * escala, y2 * escala, aristas.get((origen, destino), simbolo), origen, destino, color=COLOR_RESALTADO, escala=escala, etiqueta="resaltado")
+    if estado in posiciones:
+        x, y = posiciones[estado]
+        radio = 34 * escala # Un poco más grande que el círculo del estado
+        canvas.create_oval(x * escala - radio, y * escala - radio, x * escala + radio, y * escala + radio, outline=COLOR_RESALTADO, width=3, tags="resaltado")
+    texto = f"Paso {paso}/{len(traza_actual) - 1}: estado {estado if estado is not None else 'muerto'}"
+    if transicion is not None:
+        texto += f", leyó '{transicion[1]}'"
+    if paso == len(traza_actual) - 1:
+        texto += " - ACEPTADA" if traza_actual.aceptada else " - RECHAZADA"
+    label_traza.config(text=texto)
+
+def avanzar_animacion(): # Función que muestra el paso siguiente y programa el próximo
+    global animacion
+    if traza_actual is None or paso_actual + 1 >= len(traza_actual): # Llegó al final de la traza
+        animacion = None
+        button_reproducir.config(text="Reproducir")
+        return
+    mostrar_paso(paso_actual + 1)
+    barra_traza.set(paso_actual)
+    animacion = root.after(DEMORA_ANIMACION, avanzar_animacion)
+
+def reproducir_pausar(): # Función que inicia o pausa la animación de la traza
+    global animacion
+    if traza_actual is None:
+        return
+    if animacion is not None: # Está reproduciendo: se pausa
+        root.after_cancel(animacion)
+        animacion = None
+        button_reproducir.config(text="Reproducir")
+        return
+    if paso_actual + 1 >= len(traza_actual): # Está al final: vuelve a empezar
+        mostrar_paso(0)
+        barra_traza.set(0)
+    button_reproducir.config(text="Pausar")
+    animacion = root.after(DEMORA_ANIMACION, avanzar_animacion)
+
+def ir_a_paso(valor): # Función que se llama al mover la barra de la traza
+    paso = int(float(valor))
+    if traza_actual is not None and paso != paso_actual: # Evita redibujar cuando la barra la movió la animación
+        mostrar_paso(paso)
+
+def paso_anterior(): # Función que retrocede un paso de la traza
+    if traza_actual is not None and paso_actual > 0:
+        mostrar_paso(paso_actual - 1)
+        barra_traza.set(paso_actual)
+
+def paso_siguiente(): # Función que avanza un paso de la traza
+    if traza_actual is not None and paso_actual + 1 < len(traza_actual):
+        mostrar_paso(paso_actual + 1)
+        barra_traza.set(paso_actual)
+
+TIPOS_DE_ARCHIVO = [("AFD binario", "*.afd"), ("JSON", "*.json"), ("CSV", "*.csv")] # Formatos de archivo admitidos por la interfaz
+
+def cargar_afd(): # Función para cargar un AFD desde un archivo
+    ruta = filedialog.askopenfilename(filetypes=TIPOS_DE_ARCHIVO) # Pide el archivo a cargar
+    if not ruta: # El usuario canceló el diálogo
+        return
+    try:
+        if ruta.endswith('.json'):
+            nuevo_afd = AFD.cargar_json(ruta)
+        elif ruta.endswith('.csv'):
+            nuevo_afd = AFD.cargar_csv(ruta)
+        else:
+            nuevo_afd = AFD.cargar_binario(ruta)
+    except (OSError, ValueError, KeyError) as e: # Captura errores de lectura o de formato
+        messagebox.showerror("Error", f"No se pudo cargar el AFD: {e}")
+        return
+    mostrar_afd(nuevo_afd)
+
+def mostrar_afd(nuevo_afd): # Función que reemplaza el AFD actual y actualiza toda la interfaz de una vez
+    global afd
+    detener_traza() # La traza pertenece al AFD anterior
+    afd = nuevo_afd # Reemplaza el AFD actual
+    reiniciar_lienzo() # Descarta la disposición del AFD anterior
+    listbox_transiciones.delete(0, tk.END) # Limpia la lista de transiciones
+    listbox_transiciones.insert(tk.END, *(f"  {estado_origen} -- {simbolo} --> {estado_destino}" for estado_origen, simbolo, estado_destino in afd.lista_transiciones())) # Inserta todas las transiciones de una vez
+    label_estado_actual.config(text=f"Estado inicial: {afd.estado_inicial}, Estados finales: {sorted(afd.estados_finales)}") # Actualiza la etiqueta de estado actual
+    actualizar_visualizacion() # Un solo redibujo para todo el AFD cargado
+
+def construir_desde_expresion(): # Función para reemplazar el AFD actual por el de una expresión regular
+    patron = entry_expresion.get() # Obtiene la expresión ingresada en el campo de entrada
+    if not patron: # Verifica si la expresión no está ingresada
+        messagebox.showwarning("Advertencia", "Ingrese la expresión regular.")
+        return
+    try:
+        nuevo_afd = compilar_expresion(patron).copiar() # Copia el AFD para que editarlo no modifique la caché de expresiones
+    except ValueError as e:
+        messagebox.showerror("Error", str(e))
+        return
+    mostrar_afd(nuevo_afd)
+    entry_expresion.delete(0, tk.END)
+
+def guardar_afd(): # Función para guardar el AFD actual en un archivo
+    ruta = filedialog.asksaveasfilename(filetypes=TIPOS_DE_ARCHIVO, defaultextension=".afd") # Pide dónde guardar el AFD
+    if not ruta: # El usuario canceló el diálogo
+        return
+    try:
+        if ruta.endswith('.json'):
+            afd.guardar_json(ruta)
+        elif ruta.endswith('.csv'):
+            afd.guardar_csv(ruta)
+        else:
+            afd.guardar_binario(ruta)
+    except OSError as e:
+        messagebox.showerror("Error", f"No se pudo guardar el AFD: {e}")
 
 
 
 
-def dibujar_estado(canvas, x, y, nombre, es_inicial, es_final): # Función para dibujar un estado en el canvas 
-    radio = 30 # Radio del círculo del estado
-    canvas.create_oval(x - radio, y - radio, x + radio, y + radio, outline='white') # Dibuja el círculo del estado
+def dibujar_estado(canvas, x, y, nombre, es_inicial, es_final, escala=1, etiqueta=None): # Función para dibujar un estado en el canvas 
+    radio = 30 * escala # Radio del círculo del estado
+    canvas.create_oval(x - radio, y - radio, x + radio, y + radio, outline='white', tags=etiqueta) # Dibuja el círculo del estado
     fuente_estado = ('Helvetica', 15) # Fuente para el nombre del estado 
     fuente_transiciones = ('Helvetica', 12, 'bold') 
     # Usar estas fuentes al crear textos en el canvas
-    canvas.create_text(x, y, text=nombre, font=fuente_transiciones, fill='white') # Dibuja el nombre del estado
+    canvas.create_text(x, y, text=nombre, font=fuente_transiciones, fill='white', tags=etiqueta) # Dibuja el nombre del estado
     if es_inicial: # Verifica si el estado es el estado inicial
-        canvas.create_line(x - radio * 2, y, x - radio, y, arrow=tk.LAST, fill='white') # Dibuja la flecha indicando el estado inicial
+        canvas.create_line(x - radio * 2, y, x - radio, y, arrow=tk.LAST, fill='white', tags=etiqueta) # Dibuja la flecha indicando el estado inicial
     if es_final:
-        canvas.create_oval(x - radio + 5, y - radio + 5, x + radio - 5, y + radio - 5, outline='white') # Dibuja un círculo más pequeño para indicar el estado final
+        canvas.create_oval(x - radio + 5 * escala, y - radio + 5 * escala, x + radio - 5 * escala, y + radio - 5 * escala, outline='white', tags=etiqueta) # Dibuja un círculo más pequeño para indicar el estado final
 
 
 
 
-def dibujar_transicion(canvas, x1, y1, x2, y2, simbolo, estado_origen, estado_destino, lados_transiciones, angulo_offset=0, color="white"): # Función para dibujar una transición en el canvas
-    radio = 20 # Radio del círculo de la transición
+def dibujar_transicion(canvas, x1, y1, x2, y2, simbolo, estado_origen, estado_destino, angulo_offset=0, color="white", escala=1, etiqueta=None): # Función para dibujar una transición en el canvas
     if estado_origen == estado_destino:  # Verifica si es un bucle
         # Coordenadas para el arco circular que forma el bucle
         arc_start = 30  # Ángulo de inicio
         arc_extent = 300  # Extensión del arco
-        bucle_size = 30  # Ajusta al tamaño del bucle
+        bucle_size = 30 * escala  # Ajusta al tamaño del bucle
         canvas.create_arc(x1 - bucle_size, y1 - bucle_size, x1 + bucle_size, y1 + bucle_size,
-                          start=arc_start, extent=arc_extent, style=tk.ARC, outline=color, width=2) # Dibuja el arco del bucle 
+                          start=arc_start, extent=arc_extent, style=tk.ARC, outline=color, width=2, tags=etiqueta) # Dibuja el arco del bucle 
         # Ubicación del símbolo para el bucle
-        canvas.create_text(x1 + bucle_size + 10, y1 - 10, text=simbolo, fill=color) # Dibuja el símbolo del bucle 
+        canvas.create_text(x1 + bucle_size + 10 * escala, y1 - 10 * escala, text=simbolo, fill=color, tags=etiqueta) # Dibuja el símbolo del bucle 
         # Dibuja una flecha al final del arco para indicar dirección
         angle_rad = math.radians(arc_start + arc_extent) # Ángulo de la flecha en radianes 
         arrow_x = x1 + bucle_size * math.cos(angle_rad) # Coordenada x de la flecha 
         arrow_y = y1 - bucle_size * math.sin(angle_rad) # Coordenada y de la flecha
-        canvas.create_line(arrow_x, arrow_y, arrow_x + 5, arrow_y + 5, arrow=tk.LAST, fill=color) # Dibuja la flecha al final del arco 
+        canvas.create_line(arrow_x, arrow_y, arrow_x + 5 * escala, arrow_y + 5 * escala, arrow=tk.LAST, fill=color, tags=etiqueta) # Dibuja la flecha al final del arco 
     else:
         # Cálculo de transiciones normales (No bucles)
         angulo = math.atan2(y2 - y1, x2 - x1) + angulo_offset # Cálculo del ángulo de la transición 
@@ -181,128 +271,377 @@ def dibujar_transicion(canvas, x1, y1, x2, y2, simbolo, estado_origen, estado_de
         control_y = (y1 + y2) / 2 - curva * math.cos(angulo) # Cálculo de la coordenada y del punto de control de la curva 
 
         canvas.create_line(x1, y1, control_x, control_y, x2, y2,
-                           smooth=True, arrow=tk.LAST, fill=color) # Dibuja la transición con una curva suave y una flecha al final 
-        canvas.create_text(control_x, control_y, text=simbolo, fill=color) # Dibuja el símbolo de la transición en el punto de control 
+                           smooth=True, arrow=tk.LAST, fill=color, tags=etiqueta) # Dibuja la transición con una curva suave y una flecha al final 
+        canvas.create_text(control_x, control_y, text=simbolo, fill=color, tags=etiqueta) # Dibuja el símbolo de la transición en el punto de control 
+
+
+
+
+# Disposición de los estados: las posiciones se guardan en coordenadas del mundo y se calculan una sola vez por estado
+MARGEN = 100 # Distancia entre el borde del mundo y la primera capa
+SEPARACION_CAPAS = 150 # Distancia horizontal entre capas
+SEPARACION_ESTADOS = 110 # Distancia vertical entre estados de una misma capa
+TAMANO_CELDA = 300 # Tamaño de las celdas de la grilla usada para descartar lo que está fuera de la vista
+
+def calcular_disposicion(estados, transiciones, estado_inicial): # Función que calcula una disposición por capas (estilo Sugiyama) para todos los estados
+    vecinos = {estado: set() for estado in estados} # Vecinos sin dirección de cada estado
+    for origen, trans in transiciones.items():
+        for destino in trans.values():
+            if origen != destino:
+                vecinos[origen].add(destino)
+                vecinos[destino].add(origen)
+    # 1. Capas: distancia en anchura desde el estado inicial; los estados inalcanzables inician recorridos propios
+    capa_de = {}
+    capas = []
+    raices = ([estado_inicial] if estado_inicial in vecinos else []) + sorted(estados)
+    for raiz in raices:
+        if raiz in capa_de:
+            continue
+        capa_de[raiz] = 0
+        pendientes = [raiz]
+        for estado in pendientes: # Recorrido en anchura; la lista crece mientras se recorre
+            if capa_de[estado] == len(capas):
+                capas.append([])
+            capas[capa_de[estado]].append(estado)
+            for destino in sorted(transiciones.get(estado, {}).values()):
+                if destino not in capa_de:
+                    capa_de[destino] = capa_de[estado] + 1
+                    pendientes.append(destino)
+    # 2. Orden dentro de cada capa: baricentro de los vecinos en la capa anterior y luego en la siguiente
+    indice = {estado: i for capa in capas for i, estado in enumerate(capa)}
+    for recorrido in (range(1, len(capas)), range(len(capas) - 2, -1, -1)):
+        for i in recorrido:
+            referencia = i - 1 if recorrido.step == 1 else i + 1 # Capa ya ordenada con la que se compara
+
+            def baricentro(estado):
+                posiciones = [indice[vecino] for vecino in vecinos[estado] if capa_de[vecino] == referencia]
+                return sum(posiciones) / len(posiciones) if posiciones else indice[estado]
+
+            capas[i].sort(key=baricentro)
+            for j, estado in enumerate(capas[i]):
+                indice[estado] = j
+    # 3. Coordenadas: una columna por capa
+    return {estado: (MARGEN + capa_de[estado] * SEPARACION_CAPAS, MARGEN + indice[estado] * SEPARACION_ESTADOS) for estado in estados}
+
+
+# Estado de la visualización: lo que está ubicado y lo que está dibujado en el canvas
+posiciones = {} # Estado -> (x, y) en coordenadas del mundo
+celdas = {} # Celda de la grilla -> conjunto de estados ubicados en ella
+altura_columnas = {} # Coordenada x de una columna -> siguiente coordenada y libre
+etiquetas_estados = {} # Estado -> tag de sus elementos en el canvas
+aristas = {} # (origen, destino) -> texto con los símbolos de la transición
+aristas_de = {} # Estado -> aristas que entran o salen de él
+estados_dibujados = {} # Estado dibujado -> (es_inicial, es_final) con que se dibujó
+aristas_dibujadas = set() # Aristas que tienen elementos en el canvas
+rango_visible = [0, 0, -1, -1] # Celdas de la grilla que intersectan la vista actual: x mínima, y mínima, x máxima, y máxima
+escala = 1.0 # Factor de zoom: coordenadas del canvas = coordenadas del mundo * escala
+
+def _celda(posicion): # Función que retorna la celda de la grilla que contiene la posición
+    return (int(posicion[0] // TAMANO_CELDA), int(posicion[1] // TAMANO_CELDA))
+
+def _fijar_posicion(estado, posicion): # Función que guarda la posición de un estado y lo agrega a la grilla
+    posiciones[estado] = posicion
+    celdas.setdefault(_celda(posicion), set()).add(estado)
+    altura_columnas[posicion[0]] = max(altura_columnas.get(posicion[0], MARGEN), posicion[1] + SEPARACION_ESTADOS)
+    if estado not in etiquetas_estados:
+        etiquetas_estados[estado] = f"estado{len(etiquetas_estados)}"
+
+def ubicar_estado(estado): # Función que ubica un estado nuevo en la columna siguiente a la de un vecino ya ubicado, sin mover a los demás
+    x = MARGEN
+    for origen in afd.obtener_predecesores(estado): # Prefiere la columna a la derecha de un predecesor
+        if origen in posiciones and origen != estado:
+            x = posiciones[origen][0] + SEPARACION_CAPAS
+            break
+    else:
+        for destino in afd.transiciones.get(estado, {}).values(): # Si no, la columna a la izquierda de un sucesor
+            if destino in posiciones and destino != estado:
+                x = max(MARGEN, posiciones[destino][0] - SEPARACION_CAPAS)
+                break
+    _fijar_posicion(estado, (x, altura_columnas.get(x, MARGEN)))
+
+def _quitar_posicion(estado): # Función que olvida la posición de un estado eliminado
+    celda = _celda(posiciones.pop(estado))
+    celdas[celda].discard(estado)
+    if not celdas[celda]:
+        del celdas[celda]
+
+def _es_visible(estado): # Función que indica si el estado está dentro de la vista actual
+    cx, cy = _celda(posiciones[estado])
+    return rango_visible[0] <= cx <= rango_visible[2] and rango_visible[1] <= cy <= rango_visible[3]
+
+def _dibujar_estado(estado): # Función que (re)dibuja los elementos de un estado
+    etiqueta = etiquetas_estados[estado]
+    canvas.delete(etiqueta)
+    marcas = (estado == afd.estado_inicial, estado in afd.estados_finales)
+    x, y = posiciones[estado]
+    dibujar_estado(canvas, x * escala, y * escala, estado, *marcas, escala=escala, etiqueta=etiqueta)
+    estados_dibujados[estado] = marcas
+
+def _borrar_estado(estado): # Función que quita del canvas los elementos de un estado
+    canvas.delete(etiquetas_estados[estado])
+    estados_dibujados.pop(estado, None)
+
+def _etiqueta_arista(clave): # Función que retorna el tag de los elementos de una arista
+    return f"arista{etiquetas_estados[clave[0]]}_{etiquetas_estados[clave[1]]}"
+
+def _dibujar_arista(clave): # Función que (re)dibuja los elementos de una arista
+    etiqueta = _etiqueta_arista(clave)
+    canvas.delete(etiqueta)
+    origen, destino = clave
+    x1, y1 = posiciones[origen]
+    x2, y2 = posiciones[destino]
+    dibujar_transicion(canvas, x1 * escala, y1 * escala, x2 * escala, y2 * escala, aristas[clave], origen, destino, escala=escala, etiqueta=etiqueta)
+    aristas_dibujadas.add(clave)
+
+def _borrar_arista(clave): # Función que quita del canvas los elementos de una arista
+    canvas.delete(_etiqueta_arista(clave))
+    aristas_dibujadas.discard(clave)
+
+def sincronizar_estado(estado): # Función que actualiza solo los elementos de un estado después de una edición
+    if estado not in afd.todos_los_estados: # El estado fue eliminado del AFD
+        if estado in posiciones:
+            _borrar_estado(estado)
+            _quitar_posicion(estado)
+        return
+    if estado not in posiciones: # Estado nuevo: se ubica una sola vez
+        ubicar_estado(estado)
+    if _es_visible(estado):
+        if estados_dibujados.get(estado) != (estado == afd.estado_inicial, estado in afd.estados_finales): # Solo se redibuja si cambió
+            _dibujar_estado(estado)
+
+def sincronizar_arista(origen, destino): # Función que actualiza solo los elementos de la arista entre dos estados después de una edición
+    clave = (origen, destino)
+    simbolos = sorted(simbolo for simbolo, otro in afd.transiciones.get(origen, {}).items() if otro == destino) # Todas las transiciones entre ambos estados comparten una arista
+    if not simbolos: # Ya no hay transiciones entre los estados
+        if clave in aristas:
+            _borrar_arista(clave)
+            del aristas[clave]
+            for estado in clave:
+                aristas_de[estado].discard(clave)
+                if not aristas_de[estado]:
+                    del aristas_de[estado]
+        return
+    texto = ','.join(simbolos)
+    if aristas.get(clave) == texto: # La arista no cambió
+        return
+    aristas[clave] = texto
+    for estado in clave:
+        aristas_de.setdefault(estado, set()).add(clave)
+    if origen in estados_dibujados or destino in estados_dibujados: # Solo se dibuja si uno de sus extremos está a la vista
+        _dibujar_arista(clave)
+
+def _rectangulo_visible(): # Función que retorna el área visible del canvas en coordenadas del mundo
+    ancho = max(canvas.winfo_width(), int(canvas.cget('width')))
+    alto = max(canvas.winfo_height(), int(canvas.cget('height')))
+    return (canvas.canvasx(0) / escala, canvas.canvasy(0) / escala, canvas.canvasx(ancho) / escala, canvas.canvasy(alto) / escala)
+
+def actualizar_vista(evento=None): # Función que dibuja lo que entró a la vista y borra lo que salió (se llama al desplazar o hacer zoom)
+    x0, y0, x1, y1 = _rectangulo_visible()
+    cx0, cy0 = _celda((x0, y0))
+    cx1, cy1 = _celda((x1, y1))
+    rango_visible[:] = [cx0 - 1, cy0 - 1, cx1 + 1, cy1 + 1] # Incluye un borde de una celda
+    visibles = set().union(*(estados for (cx, cy), estados in celdas.items() if cx0 - 1 <= cx <= cx1 + 1 and cy0 - 1 <= cy <= cy1 + 1))
+    for estado in list(estados_dibujados): # Borra los estados que salieron de la vista
+        if estado not in visibles:
+            _borrar_estado(estado)
+    for estado in visibles: # Dibuja los estados que entraron a la vista
+        if estado not in estados_dibujados:
+            _dibujar_estado(estado)
+    for clave in list(aristas_dibujadas): # Borra las aristas sin extremos a la vista
+        if clave[0] not in visibles and clave[1] not in visibles:
+            _borrar_arista(clave)
+    for estado in visibles: # Dibuja las aristas de los estados a la vista
+        for clave in aristas_de.get(estado, ()):
+            if clave not in aristas_dibujadas:
+                _dibujar_arista(clave)
+
+def reiniciar_lienzo(): # Función que olvida la disposición y borra el canvas (al cargar otro AFD)
+    canvas.delete("all")
+    for registro in (posiciones, celdas, altura_columnas, etiquetas_estados, aristas, aristas_de, estados_dibujados, aristas_dibujadas):
+        registro.clear()
+
+def reorganizar(): # Función que recalcula la disposición por capas de todo el AFD
+    reiniciar_lienzo()
+    actualizar_visualizacion()
+    if traza_actual is not None: # Vuelve a resaltar el paso actual en la nueva disposición
+        mostrar_paso(paso_actual)
+
+def actualizar_visualizacion(): # Función que sincroniza todo el canvas con el AFD (al iniciar o al cargar un AFD; las ediciones usan sincronizar_estado y sincronizar_arista)
+    datos_afd = afd.obtener_datos_visuales() # Obtiene los datos visuales del AFD 
+    for estado in list(posiciones): # Quita los estados que ya no existen
+        if estado not in datos_afd['estados']:
+            sincronizar_estado(estado)
+    nuevos = datos_afd['estados'] - posiciones.keys()
+    if len(nuevos) > 1 and not posiciones: # Canvas vacío: se calcula la disposición por capas una sola vez
+        for estado, posicion in calcular_disposicion(datos_afd['estados'], datos_afd['transiciones'], datos_afd['estado_inicial']).items():
+            _fijar_posicion(estado, posicion)
+    else:
+        for estado in sorted(nuevos):
+            ubicar_estado(estado)
+    agrupadas = {} # Símbolos de cada arista
+    for origen, trans in datos_afd['transiciones'].items():
+        for simbolo, destino in trans.items():
+            agrupadas.setdefault((origen, destino), []).append(simbolo)
+    for clave in list(aristas): # Quita las aristas que ya no existen
+        if clave not in agrupadas:
+            sincronizar_arista(*clave)
+    for clave, simbolos in agrupadas.items(): # Registra las aristas nuevas o modificadas
+        texto = ','.join(sorted(simbolos))
+        if aristas.get(clave) != texto:
+            aristas[clave] = texto
+            for estado in clave:
+                aristas_de.setdefault(estado, set()).add(clave)
+            _borrar_arista(clave)
+    for estado in list(estados_dibujados): # Redibuja los estados cuyo tipo cambió
+        if estados_dibujados[estado] != (estado == datos_afd['estado_inicial'], estado in datos_afd['estados_finales']):
+            _dibujar_estado(estado)
+    actualizar_vista() # Dibuja lo que esté a la vista
+
+def iniciar_desplazamiento(evento): # Función que marca el punto desde donde se arrastra la vista
+    canvas.scan_mark(evento.x, evento.y)
+
+def desplazar(evento): # Función que arrastra la vista con el mouse
+    canvas.scan_dragto(evento.x, evento.y, gain=1)
+    actualizar_vista()
+
+def hacer_zoom(evento): # Función que acerca o aleja la vista manteniendo fijo el punto bajo el mouse
+    global escala
+    factor = 1.2 if evento.num == 4 or evento.delta > 0 else 1 / 1.2 # Rueda hacia arriba acerca, hacia abajo aleja
+    nueva_escala = min(4.0, max(0.05, escala * factor))
+    factor = nueva_escala / escala
+    if factor == 1:
+        return
+    x, y = canvas.canvasx(evento.x), canvas.canvasy(evento.y) # Punto bajo el mouse en coordenadas del canvas
+    canvas.scale("all", 0, 0, factor, factor) # Escala lo ya dibujado respecto al origen
+    escala = nueva_escala
+    mover_vista(x * factor - x, y * factor - y) # El punto bajo el mouse queda en el mismo lugar de la pantalla
+
+def mover_vista(dx, dy): # Función que desplaza la vista (dx, dy) pixeles del canvas y dibuja lo que entra a la vista
+    canvas.scan_mark(0, 0)
+    canvas.scan_dragto(int(-dx), int(-dy), gain=1)
+    actualizar_vista()
+
+def centrar_en(estado): # Función que desplaza la vista para que el estado quede en el centro
+    x0, y0, x1, y1 = _rectangulo_visible()
+    x, y = posiciones[estado]
+    mover_vista((x - (x0 + x1) / 2) * escala, (y - (y0 + y1) / 2) * escala)
+
+
+if __name__ == "__main__": # La interfaz solo se construye al ejecutar este archivo
+    # Inicialización de la interfaz gráfica
+    root = tk.Tk()
+    #titulo con estilo de letra
+    root.title("Simulador de AFD")
+
+    # Frame para el área de visualización del AFD
+    frame_canvas = tk.Frame(root, bg='#F7C4A5', bd=10, relief=tk.RIDGE)
+    frame_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    #BURDEDO= bg='#7C1034'
+    #CELESTE= bg='#CFE5FF'
+    # Crea el Canvas dentro del frame para el área de visualización
+    canvas = tk.Canvas(frame_canvas, width=800, height=800, bg='#4D4861')
+    canvas.configure(confine=False) # Permite desplazar la vista sin límites
+    canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    canvas.bind("<ButtonPress-1>", iniciar_desplazamiento) # Arrastrar con el mouse desplaza la vista
+    canvas.bind("<B1-Motion>", desplazar)
+    canvas.bind("<MouseWheel>", hacer_zoom) # Rueda del mouse en Windows y macOS
+    canvas.bind("<Button-4>", hacer_zoom) # Rueda del mouse en Linux
+    canvas.bind("<Button-5>", hacer_zoom)
+    canvas.bind("<Configure>", actualizar_vista) # Al cambiar el tamaño de la ventana aparecen más estados
+
+    #canvas es para dibujar los estados y transiciones del autómata
+    letra = ('Times new Roman', 12) 
+    titulo= ('Times new Roman', 15, 'underline')
+    label_transiciones = tk.Label(root, text="Transiciones:", font=titulo, fg='#36454F')
+ 
 
+    label_transiciones.pack()
+    #label es para poner texto en la interfaz gráfica  
 
+    frame_transiciones = tk.Frame(root, padx=15, pady=10 )#esta linea deja un espacio entre los elementos
+    frame_transiciones.pack(padx=10, pady=10, fill=tk.X) 
 
+    label_estado_origen = tk.Label(frame_transiciones, text="Estado origen:", font=letra, fg='#36454F')
+    label_estado_origen.pack(side=tk.LEFT) #esta linea es para que el label se vea en la interfaz gráfica
+    entry_estado_origen = tk.Entry(frame_transiciones, font=letra, width=10, bg='#fdcae1')
+    entry_estado_origen.pack(side=tk.LEFT)
 
+    label_simbolo = tk.Label(frame_transiciones, text="Símbolo:", font=letra, fg='#36454F') #crea un label con el texto "Símbolo:" y el estilo de letra
+    label_simbolo.pack(side=tk.LEFT)
+    entry_simbolo = tk.Entry(frame_transiciones, width=10, font=letra, bg='#fdcae1')
+    entry_simbolo.pack(side=tk.LEFT) 
 
-def actualizar_visualizacion(): # Función para actualizar la visualización del AFD en el canvas
-    datos_afd = afd.obtener_datos_visuales() # Obtiene los datos visuales del AFD 
-    canvas.delete("all")  # Limpia el canvas
-
-    # Calcula el punto de inicio para centrar los dibujos en el canvas
-    canvas_width = canvas.winfo_width()  # Obtiene el ancho del canvas
-    canvas_height = canvas.winfo_height()  # Obtiene el alto del canvas
-    num_estados = len(datos_afd['estados'])
-    step = 150  # Paso entre estados. Ajusta según sea necesario.
-    # Centra horizontalmente
-    initial_x = (canvas_width - step * (num_estados - 1)) // 2 if num_estados > 1 else canvas_width // 2
-    # Centra verticalmente
-    initial_y = canvas_height // 2
-
-    # Inicializa el registro de lados de transiciones para los estados actuales 
-    lados_transiciones = {estado: {'derecho': False, 'izquierdo': False} for estado in datos_afd['estados']} # Inicializa los lados de las transiciones para cada estado 
-
-    posiciones = {}
-
-    # Dibuja los estados de forma horizontal y centrados
-    for i, estado in enumerate(sorted(datos_afd['estados'])): # Itera sobre los estados ordenados
-        es_inicial = estado == datos_afd['estado_inicial'] # Verifica si el estado es el estado inicial 
-        es_final = estado in datos_afd['estados_finales'] # Verifica si el estado es un estado final 
-        posiciones[estado] = (initial_x + i * step, initial_y)  # Guarda la posición del estado
-        dibujar_estado(canvas, *posiciones[estado], estado, es_inicial, es_final)  # Dibuja el estado
-
-    # Dibuja las transiciones
-    for origen, trans in datos_afd['transiciones'].items(): # Itera sobre las transiciones de los estados 
-        x1, y1 = posiciones[origen] # Obtiene la posición del estado origen 
-        for simbolo, destino in trans.items(): # Itera sobre los símbolos y estados destino de las transiciones 
-            x2, y2 = posiciones[destino] # Obtiene la posición del estado destino 
-            dibujar_transicion(canvas, x1, y1, x2, y2, simbolo, origen, destino, lados_transiciones) # Dibuja la transición 
-
-    # Reinicia los lados de las transiciones después de dibujarlas
-    for estado in datos_afd['estados']: # Itera sobre los estados 
-        lados_transiciones[estado] = {'derecho': False, 'izquierdo': False} # Reinicia los lados de las transiciones para cada estado 
-
-
-# Inicialización de la interfaz gráfica
-root = tk.Tk()
-#titulo con estilo de letra
-root.title("Simulador de AFD")
-
-# Frame para el área de visualización del AFD
-frame_canvas = tk.Frame(root, bg='#F7C4A5', bd=10, relief=tk.RIDGE)
-frame_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-#BURDEDO= bg='#7C1034'
-#CELESTE= bg='#CFE5FF'
-# Crea el Canvas dentro del frame para el área de visualización
-canvas = tk.Canvas(frame_canvas, width=800, height=800, bg='#4D4861')
-canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-#canvas es para dibujar los estados y transiciones del autómata
-letra = ('Times new Roman', 12) 
-titulo= ('Times new Roman', 15, 'underline')
-label_transiciones = tk.Label(root, text="Transiciones:", font=titulo, fg='#36454F')
- 
+    label_estado_destino = tk.Label(frame_transiciones, text="Estado destino:", font=letra, fg='#36454F')
+    label_estado_destino.pack(side=tk.LEFT)
+    entry_estado_destino = tk.Entry(frame_transiciones, width=10, font=letra, bg='#fdcae1')
+    entry_estado_destino.pack(side=tk.LEFT)
+
+    button_agregar_transicion = tk.Button(root, text="Agregar Transición", command=agregar_transicion, font=letra,  bg="#36454F", fg="#FFFFFF") 
+    button_agregar_transicion.pack(pady=5)
 
-label_transiciones.pack()
-#label es para poner texto en la interfaz gráfica  
+    button_eliminar_transicion = tk.Button(root, text="Eliminar Transición", command=eliminar_transicion, font=letra, bg="#36454F", fg="#FFFFFF")
+    button_eliminar_transicion.pack(pady=5)
 
-frame_transiciones = tk.Frame(root, padx=15, pady=10 )#esta linea deja un espacio entre los elementos
-frame_transiciones.pack(padx=10, pady=10, fill=tk.X) 
+    listbox_transiciones = tk.Listbox(root, bg='#fdcae1', font=letra)
+    label_estado_inicial = tk.Label(root, text="Estado Inicial:", font=letra, fg='#36454F')
+    listbox_transiciones.pack()
 
-label_estado_origen = tk.Label(frame_transiciones, text="Estado origen:", font=letra, fg='#36454F')
-label_estado_origen.pack(side=tk.LEFT) #esta linea es para que el label se vea en la interfaz gráfica
-entry_estado_origen = tk.Entry(frame_transiciones, font=letra, width=10, bg='#fdcae1')
-entry_estado_origen.pack(side=tk.LEFT)
+    label_estado_inicial = tk.Label(root, text="Estado Inicial:", font=letra, fg='#36454F')
+    label_estado_inicial.pack()
+    entry_estado_inicial = tk.Entry(root, bg='#fdcae1', font=letra)
+    entry_estado_inicial.pack()
 
-label_simbolo = tk.Label(frame_transiciones, text="Símbolo:", font=letra, fg='#36454F') #crea un label con el texto "Símbolo:" y el estilo de letra
-label_simbolo.pack(side=tk.LEFT)
-entry_simbolo = tk.Entry(frame_transiciones, width=10, font=letra, bg='#fdcae1')
-entry_simbolo.pack(side=tk.LEFT) 
+    label_estados_finales = tk.Label(root, text="Estados Finales (separados por comas):", font=letra, fg='#36454F')
+    label_estados_finales.pack()
+    entry_estados_finales = tk.Entry(root, bg='#fdcae1', font=letra)
+    entry_estados_finales.pack()
 
-label_estado_destino = tk.Label(frame_transiciones, text="Estado destino:", font=letra, fg='#36454F')
-label_estado_destino.pack(side=tk.LEFT)
-entry_estado_destino = tk.Entry(frame_transiciones, width=10, font=letra, bg='#fdcae1')
-entry_estado_destino.pack(side=tk.LEFT)
+    button_configurar_estados = tk.Button(root, text="Ingresar los Estados", command=configurar_estados, font=letra,  bg="#36454F", fg="#FFFFFF")
+    button_configurar_estados.pack(pady=10)
 
-button_agregar_transicion = tk.Button(root, text="Agregar Transición", command=agregar_transicion, font=letra,  bg="#36454F", fg="#FFFFFF") 
-button_agregar_transicion.pack(pady=5)
+    label_estado_actual = tk.Label(root, text="Estado Inicial: None, Estados finales: None", font=letra, fg='#36454F')
+    label_estado_actual.pack(pady=10)
 
-button_eliminar_transicion = tk.Button(root, text="Eliminar Transición", command=eliminar_transicion, font=letra, bg="#36454F", fg="#FFFFFF")
-button_eliminar_transicion.pack(pady=5)
+    label_cadena = tk.Label(root, text="Ingrese la Palabra a Simular:", font=titulo, fg='#36454F')
+    label_cadena.pack()
+    entry_cadena = tk.Entry(root, font=letra, bg='#fdcae1')
+    entry_cadena.pack()
 
-listbox_transiciones = tk.Listbox(root, bg='#fdcae1', font=letra)
-label_estado_inicial = tk.Label(root, text="Estado Inicial:", font=letra, fg='#36454F')
-listbox_transiciones.pack()
+    button_simular_cadena = tk.Button(root, text="Simular Palabra", command=simular_cadena, font=letra, fg='#36454F')
+    button_simular_cadena.configure(bg="#36454F", fg="#FFFFFF")
+    button_simular_cadena.pack()
 
-label_estado_inicial = tk.Label(root, text="Estado Inicial:", font=letra, fg='#36454F')
-label_estado_inicial.pack()
-entry_estado_inicial = tk.Entry(root, bg='#fdcae1', font=letra)
-entry_estado_inicial.pack()
+    frame_traza = tk.Frame(root) # Controles para recorrer la traza de la simulación
+    frame_traza.pack(pady=5)
+    button_paso_anterior = tk.Button(frame_traza, text="<", command=paso_anterior, font=letra, bg="#36454F", fg="#FFFFFF")
+    button_paso_anterior.pack(side=tk.LEFT)
+    button_reproducir = tk.Button(frame_traza, text="Reproducir", command=reproducir_pausar, font=letra, bg="#36454F", fg="#FFFFFF")
+    button_reproducir.pack(side=tk.LEFT)
+    button_paso_siguiente = tk.Button(frame_traza, text=">", command=paso_siguiente, font=letra, bg="#36454F", fg="#FFFFFF")
+    button_paso_siguiente.pack(side=tk.LEFT)
+    barra_traza = tk.Scale(root, from_=0, to=0, orient=tk.HORIZONTAL, showvalue=False, length=300, command=ir_a_paso) # Permite saltar a cualquier paso de la traza
+    barra_traza.pack()
+    label_traza = tk.Label(root, text="", font=letra, fg='#36454F')
+    label_traza.pack()
 
-label_estados_finales = tk.Label(root, text="Estados Finales (separados por comas):", font=letra, fg='#36454F')
-label_estados_finales.pack()
-entry_estados_finales = tk.Entry(root, bg='#fdcae1', font=letra)
-entry_estados_finales.pack()
+    label_expresion = tk.Label(root, text="Expresión Regular:", font=titulo, fg='#36454F')
+    label_expresion.pack()
+    entry_expresion = tk.Entry(root, font=letra, bg='#fdcae1')
+    entry_expresion.pack()
 
-button_configurar_estados = tk.Button(root, text="Ingresar los Estados", command=configurar_estados, font=letra,  bg="#36454F", fg="#FFFFFF")
-button_configurar_estados.pack(pady=10)
+    button_construir_expresion = tk.Button(root, text="Construir AFD", command=construir_desde_expresion, font=letra, bg="#36454F", fg="#FFFFFF")
+    button_construir_expresion.pack(pady=5)
 
-label_estado_actual = tk.Label(root, text="Estado Inicial: None, Estados finales: None", font=letra, fg='#36454F')
-label_estado_actual.pack(pady=10)
+    button_reorganizar = tk.Button(root, text="Reorganizar", command=reorganizar, font=letra, bg="#36454F", fg="#FFFFFF")
+    button_reorganizar.pack(pady=5)
 
-label_cadena = tk.Label(root, text="Ingrese la Palabra a Simular:", font=titulo, fg='#36454F')
-label_cadena.pack()
-entry_cadena = tk.Entry(root, font=letra, bg='#fdcae1')
-entry_cadena.pack()
+    button_cargar_afd = tk.Button(root, text="Cargar AFD", command=cargar_afd, font=letra, bg="#36454F", fg="#FFFFFF")
+    button_cargar_afd.pack(pady=5)
 
-button_simular_cadena = tk.Button(root, text="Simular Palabra", command=simular_cadena, font=letra, fg='#36454F')
-button_simular_cadena.configure(bg="#36454F", fg="#FFFFFF")
-button_simular_cadena.pack()
+    button_guardar_afd = tk.Button(root, text="Guardar AFD", command=guardar_afd, font=letra, bg="#36454F", fg="#FFFFFF")
+    button_guardar_afd.pack(pady=5)
 
-afd = AFD()
-actualizar_visualizacion() 
+    afd = AFD()
+    actualizar_visualizacion() 
 
-root.mainloop()
\ No newline at end of file
+    root.mainloop()
\ No newline at end of file
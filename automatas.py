@@ -0,0 +1,943 @@
+# Núcleo del simulador: AFD, AFND y sus representaciones compiladas, sin depender de la interfaz gráfica
+import codecs
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+from itertools import chain, repeat
+
+# Formato binario: encabezado (magia, versión, reservado, estado muerto, ancho de fila, fila inicial, largo de los nombres),
+# tabla de enteros de 64 bits, mapa de estados finales y nombres de estados y símbolos en JSON
+_ENCABEZADO_BINARIO = struct.Struct('<4sHHqqqq')
+_MAGIA_BINARIA = b'AFDB'
+_VERSION_BINARIA = 1
+
+# Las cadenas se traducen por trozos que crecen de _TROZO_INICIAL a _TROZO_MAXIMO caracteres: si la cadena cae al estado muerto
+# al principio no se traduce el resto, y las cadenas largas no se copian enteras
+_TROZO_INICIAL = 64
+_TROZO_MAXIMO = 1 << 16
+
+# aceptar_lote avanza las cadenas juntas mientras queden al menos _UMBRAL_LOTE activas; las demás se terminan con avanzar
+_UMBRAL_LOTE = 64
+
+def _tabla_valida(tabla, fila_muerta, ancho): # Función que indica si cada destino de la tabla es el inicio de una fila existente, con NumPy si está disponible
+    try:
+        import numpy as np
+    except ImportError:
+        return all(0 <= destino <= fila_muerta and destino % ancho == 0 for destino in tabla)
+    valores = np.frombuffer(tabla, dtype=np.int64)
+    return not len(valores) or bool(valores.min() >= 0 and valores.max() <= fila_muerta and not (valores % ancho).any())
+
+
+# Definición de la tabla compilada del AFD
+class _TraduccionSimbolos(dict):
+    # Tabla para str.translate que convierte cada símbolo en el carácter de su columna; los símbolos desconocidos van a la última columna
+    def __init__(self, columnas, columna_desconocida):
+        super().__init__(columnas)
+        self.columna_desconocida = columna_desconocida
+
+    def __missing__(self, codigo): # Se llama para los caracteres que no pertenecen al alfabeto
+        return self.columna_desconocida
+
+
+class AFDCompilado:
+    # Representación plana del AFD: estados y símbolos se numeran con enteros y las transiciones se guardan en un arreglo
+    def __init__(self, afd): # Constructor que compila el AFD recibido
+        # Los IDs se asignan en orden de inserción (sin ordenar) para admitir nombres de tipos distintos, por ejemplo 0 y 'fin'
+        self.estados = list(dict.fromkeys(chain(afd.transiciones, (destino for trans in afd.transiciones.values() for destino in trans.values()), afd.todos_los_estados))) # Lista de estados, la posición de cada estado es su ID
+        self.id_estado = {estado: i for i, estado in enumerate(self.estados)} # Diccionario de nombre de estado a ID
+        self.alfabeto = list(dict.fromkeys(simbolo for trans in afd.transiciones.values() for simbolo in trans)) # Lista de símbolos, la posición de cada símbolo es su ID
+        self.id_simbolo = {simbolo: i for i, simbolo in enumerate(self.alfabeto)} # Diccionario de símbolo a ID
+        self.desconocido = len(self.alfabeto) # Columna extra para símbolos fuera del alfabeto, siempre lleva al estado muerto
+        self.num_simbolos = len(self.alfabeto) + 1 # Ancho de cada fila de la tabla
+        self.muerto = len(self.estados) # ID del estado muerto (centinela), que no pertenece al AFD
+        # La tabla guarda el desplazamiento de la fila destino (ID * ancho) para no multiplicar en cada paso
+        self.fila_muerta = self.muerto * self.num_simbolos # Desplazamiento de la fila del estado muerto
+        self.tabla = array('q', [self.fila_muerta]) * ((self.muerto + 1) * self.num_simbolos) # Todas las transiciones apuntan al estado muerto por defecto
+        for origen, trans in afd.transiciones.items(): # Itera sobre las transiciones de cada estado
+            fila = self.id_estado[origen] * self.num_simbolos # Desplazamiento de la fila del estado origen
+            for simbolo, destino in trans.items(): # Itera sobre los símbolos y estados destino
+                self.tabla[fila + self.id_simbolo[simbolo]] = self.id_estado[destino] * self.num_simbolos # Guarda la fila destino
+        self.finales = bytearray(self.muerto + 1) # Mapa de bits de estados finales (el estado muerto nunca es final)
+        for estado in afd.estados_finales: # Marca cada estado final
+            if estado in self.id_estado: # Ignora estados finales que ya no existan
+                self.finales[self.id_estado[estado]] = 1
+        # Si no hay estado inicial se parte del estado muerto, igual que el recorrido por diccionarios que retorna False
+        self.inicial = self.id_estado.get(afd.estado_inicial, self.muerto) * self.num_simbolos # Desplazamiento de la fila inicial
+        # Si todas las columnas caben en un byte, las cadenas se traducen a bytes con str.translate y se recorren sin buscar en diccionarios
+        self.traduccion = None
+        self._mapa = None # Solo las tablas cargadas con cargar_binario están mapeadas desde un archivo
+        if self.num_simbolos <= 256:
+            self.traduccion = _TraduccionSimbolos({ord(simbolo): chr(i) for simbolo, i in self.id_simbolo.items() if isinstance(simbolo, str) and len(simbolo) == 1}, chr(self.desconocido))
+
+    def codificar(self, cadena): # Método que convierte toda la cadena en la secuencia de columnas de sus símbolos (para aceptar_lote)
+        if self.traduccion is not None and isinstance(cadena, str): # Camino rápido: traduce toda la cadena de una vez
+            return cadena.translate(self.traduccion).encode('latin-1')
+        id_simbolo = self.id_simbolo
+        desconocido = self.desconocido
+        return [id_simbolo.get(simbolo, desconocido) for simbolo in cadena] # Camino general símbolo por símbolo
+
+    def trozos(self, cadena): # Método que genera las columnas de la cadena por trozos, sin codificar lo que no se llega a leer
+        if self.traduccion is not None and isinstance(cadena, str): # Camino rápido: traduce trozos cada vez más grandes
+            traduccion = self.traduccion
+            inicio, tamano = 0, _TROZO_INICIAL
+            while inicio < len(cadena):
+                yield cadena[inicio:inicio + tamano].translate(traduccion).encode('latin-1')
+                inicio += tamano
+                tamano = min(tamano * 2, _TROZO_MAXIMO)
+        else: # Camino general: busca cada símbolo recién cuando se lee
+            yield map(self.id_simbolo.get, cadena, repeat(self.desconocido))
+
+    def guardar_binario(self, ruta): # Método que guarda la tabla compilada en formato binario (encabezado + tabla de enteros)
+        nombres = json.dumps({'estados': self.estados, 'alfabeto': self.alfabeto}).encode('utf-8') # Nombres de estados y símbolos
+        tabla = array('q', self.tabla)
+        if sys.byteorder != 'little': # El archivo siempre se guarda en little-endian
+            tabla.byteswap()
+        # Se escribe en un archivo temporal que después reemplaza al destino: si la tabla está mapeada desde ese mismo archivo,
+        # abrirlo con 'wb' lo truncaría mientras todavía se lee
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        try:
+            with open(temporal, 'wb') as archivo:
+                archivo.write(_ENCABEZADO_BINARIO.pack(_MAGIA_BINARIA, _VERSION_BINARIA, 0, self.muerto, self.num_simbolos, self.inicial, len(nombres)))
+                archivo.write(tabla.tobytes()) # La tabla queda alineada a 8 bytes justo después del encabezado
+                archivo.write(bytes(self.finales))
+                archivo.write(nombres)
+            os.replace(temporal, ruta)
+        except BaseException:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            raise
+
+    @classmethod
+    def cargar_binario(cls, ruta): # Método que abre un archivo binario mapeándolo en memoria, sin recorrer la tabla en Python
+        # Para solo verificar cadenas conviene usar este método directamente (por ejemplo AFDCompilado.cargar_binario(ruta).aceptar(cadena)):
+        # AFD.cargar_binario además reconstruye los diccionarios de transiciones y el índice de transiciones entrantes
+        with open(ruta, 'rb') as archivo:
+            if os.fstat(archivo.fileno()).st_size < _ENCABEZADO_BINARIO.size: # mmap no admite archivos vacíos
+                raise ValueError("El archivo es demasiado corto para contener un AFD en formato binario.")
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        tabla = None
+        try:
+            magia, version, _, muerto, num_simbolos, inicial, largo_nombres = _ENCABEZADO_BINARIO.unpack_from(mapa)
+            if magia != _MAGIA_BINARIA or version != _VERSION_BINARIA:
+                raise ValueError("El archivo no contiene un AFD en formato binario válido.")
+            if muerto < 0 or num_simbolos < 1 or largo_nombres < 0:
+                raise ValueError("El encabezado del archivo binario es inválido.")
+            fila_muerta = muerto * num_simbolos
+            inicio_finales = _ENCABEZADO_BINARIO.size + (muerto + 1) * num_simbolos * 8
+            inicio_nombres = inicio_finales + muerto + 1
+            if len(mapa) < inicio_nombres + largo_nombres:
+                raise ValueError("El archivo binario está truncado.")
+            if not 0 <= inicial <= fila_muerta or inicial % num_simbolos:
+                raise ValueError("El estado inicial del archivo binario está fuera de la tabla.")
+            nombres = json.loads(mapa[inicio_nombres:inicio_nombres + largo_nombres].decode('utf-8'))
+            if not isinstance(nombres, dict) or not isinstance(nombres.get('estados'), list) or not isinstance(nombres.get('alfabeto'), list) \
+                    or len(nombres['estados']) != muerto or len(nombres['alfabeto']) != num_simbolos - 1:
+                raise ValueError("Los nombres del archivo binario no coinciden con la tabla.")
+            if any(isinstance(nombre, (list, dict)) for nombre in chain(nombres['estados'], nombres['alfabeto'])):
+                raise ValueError("Los nombres del archivo binario son inválidos.")
+            if sys.byteorder == 'little':
+                tabla = memoryview(mapa)[_ENCABEZADO_BINARIO.size:inicio_finales].cast('q') # La tabla se usa directamente desde el archivo
+            else:
+                tabla = array('q', mapa[_ENCABEZADO_BINARIO.size:inicio_finales])
+                tabla.byteswap()
+            if not _tabla_valida(tabla, fila_muerta, num_simbolos): # Un destino fuera de rango haría leer fuera de la tabla y uno desalineado mezclaría dos filas
+                raise ValueError("La tabla del archivo binario tiene destinos inválidos.")
+        except Exception:
+            if isinstance(tabla, memoryview):
+                tabla.release() # El mapa no se puede cerrar mientras haya vistas sobre él
+            mapa.close()
+            raise
+        compilado = cls.__new__(cls) # Se construye sin pasar por el constructor, que compila desde un AFD
+        compilado._mapa = mapa # Mantiene abierto el archivo mapeado mientras se use la tabla; se libera con cerrar()
+        compilado.tabla = tabla
+        compilado.finales = memoryview(mapa)[inicio_finales:inicio_nombres]
+        compilado.estados = nombres['estados']
+        compilado.alfabeto = nombres['alfabeto']
+        compilado.id_estado = {estado: i for i, estado in enumerate(compilado.estados)}
+        compilado.id_simbolo = {simbolo: i for i, simbolo in enumerate(compilado.alfabeto)}
+        compilado.desconocido = len(compilado.alfabeto)
+        compilado.num_simbolos = num_simbolos
+        compilado.muerto = muerto
+        compilado.fila_muerta = fila_muerta
+        compilado.inicial = inicial
+        compilado.traduccion = None
+        if num_simbolos <= 256:
+            compilado.traduccion = _TraduccionSimbolos({ord(simbolo): chr(i) for simbolo, i in compilado.id_simbolo.items() if isinstance(simbolo, str) and len(simbolo) == 1}, chr(compilado.desconocido))
+        return compilado
+
+    def cerrar(self): # Método que libera el archivo mapeado por cargar_binario; después de cerrarla la tabla ya no se puede usar
+        if self._mapa is None: # La tabla no está mapeada desde un archivo
+            return
+        if isinstance(self.tabla, memoryview):
+            self.tabla.release() # El mapa no se puede cerrar mientras haya vistas sobre él
+        self.finales.release()
+        self._mapa.close()
+        self._mapa = None
+
+    def __enter__(self): # Permite usar la tabla cargada con with, que la cierra al terminar
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def avanzar(self, fila, cadena): # Método que recorre la cadena desde la fila dada y retorna la fila alcanzada
+        fila_muerta = self.fila_muerta
+        if fila == fila_muerta: # Desde el estado muerto no se puede salir
+            return fila
+        tabla = self.tabla # Referencia local para acelerar el ciclo
+        if self.traduccion is not None and isinstance(cadena, str) and len(cadena) <= _TROZO_INICIAL: # Las cadenas cortas se traducen de una vez sin crear el generador
+            trozos = (cadena.translate(self.traduccion).encode('latin-1'),)
+        else:
+            trozos = self.trozos(cadena)
+        for trozo in trozos: # Itera sobre los trozos codificados de la cadena
+            for columna in trozo: # Itera sobre la columna de cada símbolo del trozo
+                fila = tabla[fila + columna] # Avanza al estado destino
+                if fila == fila_muerta: # Llegó al estado muerto: no hay transición para el símbolo, el resto no se codifica
+                    return fila
+        return fila
+
+    def es_final(self, fila): # Método que indica si la fila corresponde a un estado final
+        return self.finales[fila // self.num_simbolos] == 1
+
+    def aceptar(self, cadena): # Método para verificar si una cadena es aceptada usando la tabla plana
+        return self.es_final(self.avanzar(self.inicial, cadena)) # Retorna True si el estado alcanzado es final
+
+    def trazar(self, cadena): # Método que recorre la cadena una sola vez guardando el ID de cada estado visitado
+        ancho = self.num_simbolos
+        fila_muerta = self.fila_muerta
+        tabla = self.tabla
+        fila = self.inicial
+        recorrido = array('i', [fila // ancho]) # IDs de los estados visitados, empezando por el inicial
+        agregar = recorrido.append
+        if fila != fila_muerta:
+            for columna in chain.from_iterable(self.trozos(cadena)):
+                fila = tabla[fila + columna]
+                agregar(fila // ancho)
+                if fila == fila_muerta: # El recorrido termina en el estado muerto
+                    break
+        return Traza(self, cadena, recorrido)
+
+    def aceptar_lote(self, cadenas): # Método para verificar muchas cadenas a la vez avanzando todas juntas por la tabla; retorna una lista de booleanos
+        cadenas = list(cadenas)
+        try:
+            import numpy as np # NumPy es opcional y se importa recién aquí para no demorar la importación del módulo
+        except ImportError:
+            np = None
+        if np is None or self.inicial == self.fila_muerta: # Sin NumPy (o sin estado inicial) se verifica cada cadena por separado
+            return [self.aceptar(cadena) for cadena in cadenas]
+        # Codifica todas las cadenas en un único arreglo de columnas, con el tipo entero más chico que alcance
+        if self.traduccion is not None and all(isinstance(cadena, str) for cadena in cadenas):
+            codigos = np.frombuffer(''.join(cadenas).translate(self.traduccion).encode('latin-1'), dtype=np.uint8)
+        else:
+            codigos = np.fromiter(chain.from_iterable(self.codificar(cadena) for cadena in cadenas), dtype=np.min_scalar_type(self.desconocido))
+        longitudes = np.fromiter((len(cadena) for cadena in cadenas), dtype=np.int64, count=len(cadenas))
+        estados = np.full(len(cadenas), self.inicial, dtype=np.int64) # Fila alcanzada por cada cadena
+        tabla = np.frombuffer(self.tabla, dtype=np.int64)
+        activas = np.flatnonzero(longitudes) # Cadenas que todavía tienen símbolos por leer
+        filas = estados[activas] # Fila actual de cada cadena activa
+        siguientes = (np.cumsum(longitudes) - longitudes)[activas] # Posición del próximo símbolo de cada cadena activa en el arreglo de códigos
+        restantes = longitudes[activas] # Símbolos que le quedan por leer a cada cadena activa
+        posicion = 0
+        # En cada posición se avanzan todas las cadenas activas con una sola búsqueda en la tabla; las que terminan o llegan al
+        # estado muerto salen del conjunto activo, así que el trabajo es proporcional a los símbolos que realmente se leen
+        while len(activas) >= _UMBRAL_LOTE:
+            filas = tabla[filas + codigos[siguientes]]
+            siguientes += 1
+            restantes -= 1
+            posicion += 1
+            siguen = (restantes > 0) & (filas != self.fila_muerta)
+            if not siguen.all():
+                terminadas = ~siguen
+                estados[activas[terminadas]] = filas[terminadas]
+                activas, filas, siguientes, restantes = activas[siguen], filas[siguen], siguientes[siguen], restantes[siguen]
+        for i, fila in zip(activas.tolist(), filas.tolist()): # Quedan pocas cadenas (por ejemplo una mucho más larga que el resto): se terminan una por una
+            estados[i] = self.avanzar(fila, cadenas[i][posicion:])
+        # El estado muerto es absorbente y no es final, así que los símbolos fuera del alfabeto terminan en rechazo
+        return np.frombuffer(bytes(self.finales), dtype=np.uint8)[estados // self.num_simbolos].astype(bool).tolist()
+
+
+# Definición de la traza de una simulación
+class Traza:
+    # Secuencia de estados visitados al leer una cadena, guardada como un arreglo de IDs para poder recorrerla en cualquier orden
+    def __init__(self, compilado, cadena, recorrido): # Constructor que guarda el recorrido calculado por AFDCompilado.trazar
+        self.compilado = compilado
+        self.cadena = cadena
+        self.recorrido = recorrido # recorrido[i] es el ID del estado después de leer i símbolos
+        self.aceptada = compilado.finales[recorrido[-1]] == 1 # El estado muerto nunca es final
+
+    def __len__(self): # Cantidad de posiciones de la traza (símbolos leídos + 1)
+        return len(self.recorrido)
+
+    def estado(self, paso): # Método que retorna el nombre del estado en el paso dado, o None si es el estado muerto
+        identificador = self.recorrido[paso]
+        return None if identificador == self.compilado.muerto else self.compilado.estados[identificador]
+
+    def transicion(self, paso): # Método que retorna la transición (origen, símbolo, destino) usada para llegar al paso dado
+        if paso == 0: # El primer paso es el estado inicial, sin transición
+            return None
+        return (self.estado(paso - 1), self.cadena[paso - 1], self.estado(paso))
+
+    def paso_de_rechazo(self): # Método que retorna el paso donde la cadena cayó al estado muerto, o None si no ocurrió
+        if self.recorrido[-1] == self.compilado.muerto:
+            return len(self.recorrido) - 1
+        return None
+
+
+# Definición del reconocedor incremental
+class ReconocedorIncremental:
+    # Verifica una cadena que llega por fragmentos, guardando solo el estado actual entre fragmentos
+    def __init__(self, afd): # Constructor que toma la tabla compilada del AFD
+        self.compilado = afd.compilar() # Tabla compilada, se conserva aunque el AFD se modifique después
+        self.reiniciar()
+
+    def reiniciar(self): # Método para volver al estado inicial y empezar una cadena nueva
+        self.fila = self.compilado.inicial # Fila del estado actual
+        self.simbolos_leidos = 0 # Cantidad de símbolos procesados
+
+    def muerto(self): # Método que indica si el reconocedor llegó al estado muerto, donde ya no puede aceptar
+        return self.fila == self.compilado.fila_muerta
+
+    def feed(self, fragmento): # Método para procesar el siguiente fragmento de la cadena
+        if not self.muerto(): # Una vez en el estado muerto se ignora el resto de la entrada
+            self.fila = self.compilado.avanzar(self.fila, fragmento)
+            self.simbolos_leidos += len(fragmento)
+        return self
+
+    def estado_actual(self): # Método que retorna el nombre del estado actual, o None si llegó al estado muerto
+        if self.muerto():
+            return None
+        return self.compilado.estados[self.fila // self.compilado.num_simbolos]
+
+    def resultado(self): # Método que retorna True si lo leído hasta ahora es aceptado por el AFD
+        return self.compilado.es_final(self.fila)
+
+    def procesar_archivo(self, ruta, tamano_bloque=1 << 20, codificacion='utf-8', usar_mmap=False): # Método para verificar el contenido de un archivo con memoria constante
+        decodificador = codecs.getincrementaldecoder(codificacion)() # Decodifica sin cortar caracteres que quedan entre dos bloques
+        with open(ruta, 'rb') as archivo:
+            if usar_mmap and os.fstat(archivo.fileno()).st_size > 0: # mmap no admite archivos vacíos
+                with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+                    for inicio in range(0, len(mapa), tamano_bloque): # Recorre el archivo mapeado por bloques
+                        self.feed(decodificador.decode(mapa[inicio:inicio + tamano_bloque]))
+                        if self.muerto(): # Se detiene apenas la cadena queda rechazada
+                            return False
+            else:
+                while True: # Lee el archivo en bloques de tamaño fijo
+                    bloque = archivo.read(tamano_bloque)
+                    if not bloque:
+                        break
+                    self.feed(decodificador.decode(bloque))
+                    if self.muerto(): # Se detiene apenas la cadena queda rechazada
+                        return False
+        self.feed(decodificador.decode(b'', final=True)) # Procesa lo que haya quedado en el decodificador
+        return self.resultado()
+
+
+# Definición de la instrumentación del AFD
+class Instrumentacion:
+    # Contadores opcionales de un AFD; mientras no se activan, el AFD solo paga una comparación con None por operación
+    def __init__(self): # Constructor que inicia los contadores en cero
+        self.reiniciar()
+
+    def reiniciar(self): # Método que vuelve todos los contadores a cero
+        self.cadenas = 0 # Cadenas verificadas con aceptar o aceptar_lote
+        self.pasos = 0 # Transiciones recorridas por aceptar
+        self.rechazos_anticipados = 0 # Cadenas que llegaron al estado muerto (sin transición para un símbolo)
+        self.simbolos_en_lote = 0 # Símbolos procesados por aceptar_lote
+        self.compilaciones = 0 # Veces que se construyó la tabla compilada
+        self.ediciones = {} # Operación de edición -> cantidad de veces que se ejecutó
+
+    def contar_edicion(self, operacion): # Método que cuenta una edición del AFD
+        self.ediciones[operacion] = self.ediciones.get(operacion, 0) + 1
+
+    def aceptar(self, compilado, cadena): # Método que verifica la cadena contando los pasos recorridos, sin guardar el recorrido
+        tabla = compilado.tabla
+        fila_muerta = compilado.fila_muerta
+        fila = compilado.inicial
+        pasos = 0
+        if fila != fila_muerta:
+            for columna in chain.from_iterable(compilado.trozos(cadena)):
+                fila = tabla[fila + columna]
+                pasos += 1
+                if fila == fila_muerta: # Salida anticipada: no hay transición para el símbolo
+                    break
+        self.cadenas += 1
+        self.pasos += pasos
+        if fila == fila_muerta:
+            self.rechazos_anticipados += 1
+        return compilado.es_final(fila)
+
+    def resumen(self): # Método que retorna los contadores como diccionario
+        return {
+            'cadenas': self.cadenas,
+            'pasos': self.pasos,
+            'rechazos_anticipados': self.rechazos_anticipados,
+            'simbolos_en_lote': self.simbolos_en_lote,
+            'compilaciones': self.compilaciones,
+            'ediciones': dict(self.ediciones)
+        }
+
+
+# Definición de la clase AFD
+class AFD:
+    def __init__(self): # Constructor de la clase AFD 
+        self.estado_inicial = None # Inicializa el estado inicial en None 
+        self.estados_finales = set() # Inicializa el conjunto de estados finales como un conjunto vacío 
+        self.transiciones = {} # Inicializa el diccionario de transiciones como un diccionario vacío 
+        self.todos_los_estados = set() # Inicializa el conjunto de todos los estados como un conjunto vacío 
+        self._compilado = None # Tabla compilada en caché, se invalida con cada modificación del AFD
+        self._entrantes = {} # Índice de transiciones entrantes: estado destino -> {estado origen: cantidad de transiciones}
+        self._grado_entrada = {} # Cantidad de transiciones entrantes de cada estado
+        self.instrumentacion = None # Contadores opcionales, ver activar_instrumentacion
+
+    def activar_instrumentacion(self): # Método que empieza a contar pasos, rechazos y ediciones; retorna los contadores
+        if self.instrumentacion is None:
+            self.instrumentacion = Instrumentacion()
+        return self.instrumentacion
+
+    def desactivar_instrumentacion(self): # Método que deja de contar y descarta los contadores
+        self.instrumentacion = None
+
+    def _invalidar(self, operacion): # Método para descartar la tabla compilada después de una modificación
+        self._compilado = None
+        if self.instrumentacion is not None: # Cuenta la edición solo si la instrumentación está activa
+            self.instrumentacion.contar_edicion(operacion)
+
+    def compilar(self): # Método que retorna la tabla compilada del AFD, construyéndola solo si no está en caché
+        if self._compilado is None: # Verifica si la caché fue invalidada
+            self._compilado = AFDCompilado(self) # Compila el AFD a una tabla plana
+            if self.instrumentacion is not None:
+                self.instrumentacion.compilaciones += 1
+        return self._compilado
+
+    def configurar_estado_inicial(self, estado): # Método para configurar el estado inicial 
+        if estado in self.todos_los_estados: # Verifica que el estado ingresado esté en el conjunto de todos los estados 
+            self.estado_inicial = estado # Asigna el estado ingresado como estado inicial 
+            self._invalidar('configurar_estado_inicial') # Invalida la tabla compilada
+        else:
+            raise ValueError("El estado inicial debe ser uno de los estados definidos en las transiciones.")
+
+    def agregar_transicion(self, estado_origen, simbolo, estado_destino): # Método para agregar una transición 
+        if estado_origen not in self.transiciones: # Verifica si el estado origen no está en el diccionario de transiciones 
+            self.transiciones[estado_origen] = {} # Crea un diccionario vacío para el estado origen 
+        elif simbolo in self.transiciones[estado_origen]: # Verifica si ya existe una transición con el mismo símbolo 
+            raise ValueError(f"Transición no determinista detectada: desde {estado_origen} ya existe una transición con el símbolo {simbolo}.") # Muestra un mensaje de error si ya existe una transición con el mismo símbolo 
+        self.transiciones[estado_origen][simbolo] = estado_destino # Asigna el estado destino al estado origen con el símbolo correspondiente 
+        self.todos_los_estados.update([estado_origen, estado_destino]) # Actualiza el conjunto de todos los estados con los estados involucrados en la transición 
+        self._registrar_entrante(estado_origen, estado_destino) # Actualiza el índice de transiciones entrantes
+        self._invalidar('agregar_transicion') # Invalida la tabla compilada
+
+    def _registrar_entrante(self, estado_origen, estado_destino): # Método que suma una transición al índice de transiciones entrantes
+        origenes = self._entrantes.setdefault(estado_destino, {})
+        origenes[estado_origen] = origenes.get(estado_origen, 0) + 1
+        self._grado_entrada[estado_destino] = self._grado_entrada.get(estado_destino, 0) + 1
+
+    def _quitar_entrante(self, estado_origen, estado_destino): # Método que resta una transición del índice de transiciones entrantes
+        origenes = self._entrantes[estado_destino]
+        if origenes[estado_origen] == 1: # Era la última transición entre ambos estados
+            del origenes[estado_origen]
+            if not origenes: # El estado destino ya no tiene predecesores
+                del self._entrantes[estado_destino]
+        else:
+            origenes[estado_origen] -= 1
+        if self._grado_entrada[estado_destino] == 1:
+            del self._grado_entrada[estado_destino]
+        else:
+            self._grado_entrada[estado_destino] -= 1
+
+    def _reconstruir_indice(self): # Método que reconstruye el índice de transiciones entrantes recorriendo todas las transiciones
+        self._entrantes = {}
+        self._grado_entrada = {}
+        for estado_origen, trans in self.transiciones.items():
+            for estado_destino in trans.values():
+                self._registrar_entrante(estado_origen, estado_destino)
+
+    def obtener_predecesores(self, estado): # Método que retorna el conjunto de estados con alguna transición hacia el estado
+        return set(self._entrantes.get(estado, ()))
+
+    def grado_entrada(self, estado): # Método que retorna la cantidad de transiciones que llegan al estado
+        return self._grado_entrada.get(estado, 0)
+
+    
+    def eliminar_transicion(self, estado_origen, simbolo): # Método para eliminar una transición 
+        if estado_origen in self.transiciones and simbolo in self.transiciones[estado_origen]: # Verifica si el estado origen y el símbolo existen en el diccionario de transiciones 
+            estado_destino = self.transiciones[estado_origen].pop(simbolo) # Elimina la transición del diccionario de transiciones 
+            self._quitar_entrante(estado_origen, estado_destino) # Actualiza el índice de transiciones entrantes
+            if not self.transiciones[estado_origen]: # Verifica si el estado origen no tiene más transiciones 
+                del self.transiciones[estado_origen] # Elimina el estado origen del diccionario de transiciones 
+            self._invalidar('eliminar_transicion') # Invalida la tabla compilada
+    
+    def eliminar_estado_si_es_huerfano(self, estado):
+        # Un estado huerfano es aquel que no tiene transiciones entrantes ni salientes
+        if estado not in self.transiciones and estado not in self._grado_entrada: # Verifica si el estado no está en el diccionario de transiciones y si no es un estado destino en ninguna transición 
+            self.todos_los_estados.discard(estado) # Elimina el estado del conjunto de todos los estados 
+            self.estados_finales.discard(estado) # Elimina el estado del conjunto de estados finales 
+            if self.estado_inicial == estado: # Verifica si el estado es el estado inicial 
+                self.estado_inicial = None # Asigna None al estado inicial 
+            self._invalidar('eliminar_estado_si_es_huerfano') # Invalida la tabla compilada
+
+    def eliminar_estado(self, estado): # Método para eliminar un estado junto con todas sus transiciones entrantes y salientes
+        for simbolo in list(self.transiciones.get(estado, {})): # Elimina las transiciones salientes
+            self.eliminar_transicion(estado, simbolo)
+        for estado_origen in self.obtener_predecesores(estado): # Elimina las transiciones entrantes revisando solo a los predecesores
+            for simbolo, estado_destino in list(self.transiciones[estado_origen].items()):
+                if estado_destino == estado:
+                    self.eliminar_transicion(estado_origen, simbolo)
+        self.eliminar_estado_si_es_huerfano(estado) # El estado quedó sin transiciones y se elimina
+        
+    def agregar_estado_final(self, estado): # Método para agregar un estado final 
+        if estado in self.todos_los_estados: # Verifica si el estado está en el conjunto de todos los estados 
+            self.estados_finales.add(estado) # Agrega el estado al conjunto de estados finales 
+            self._invalidar('agregar_estado_final') # Invalida la tabla compilada
+        else:
+            raise ValueError("Los estados finales deben ser uno de los estados definidos en las transiciones.")
+
+    def limpiar_estados_finales(self): # Método para quitar todos los estados finales
+        self.estados_finales.clear() # Vacía el conjunto de estados finales
+        self._invalidar('limpiar_estados_finales') # Invalida la tabla compilada
+        
+    def aceptar(self, cadena): # Método para verificar si una cadena es aceptada por el AFD 
+        if self.instrumentacion is not None: # Camino instrumentado, separado para no agregar costo al camino normal
+            return self.instrumentacion.aceptar(self.compilar(), cadena)
+        return self.compilar().aceptar(cadena) # Recorre la tabla compilada en lugar de los diccionarios anidados
+
+    def aceptar_lote(self, cadenas): # Método para verificar una lista de cadenas, retorna una lista de booleanos
+        if self.instrumentacion is not None:
+            cadenas = list(cadenas)
+            self.instrumentacion.cadenas += len(cadenas)
+            self.instrumentacion.simbolos_en_lote += sum(len(cadena) for cadena in cadenas)
+        return self.compilar().aceptar_lote(cadenas)
+
+    def trazar(self, cadena): # Método que retorna la traza con todos los estados visitados al leer la cadena
+        return self.compilar().trazar(cadena)
+
+    def reconocedor(self): # Método que crea un reconocedor incremental para cadenas que llegan por fragmentos
+        return ReconocedorIncremental(self)
+
+    def aceptar_archivo(self, ruta, tamano_bloque=1 << 20, codificacion='utf-8', usar_mmap=False): # Método para verificar si el contenido de un archivo es aceptado
+        return self.reconocedor().procesar_archivo(ruta, tamano_bloque, codificacion, usar_mmap)
+
+    def aceptar_sin_compilar(self, cadena): # Método que recorre los diccionarios de transiciones directamente (referencia para la tabla compilada)
+        estado_actual = self.estado_inicial # Inicializa el estado actual con el estado inicial 
+        for simbolo in cadena: # Itera sobre cada símbolo de la cadena 
+            estado_actual = self.transiciones.get(estado_actual, {}).get(simbolo) # Obtiene el estado destino de la transición actual 
+            if estado_actual is None: # Verifica si el estado actual es None 
+                return False # Retorna False si no hay transición para el símbolo actual
+        return estado_actual in self.estados_finales # Retorna True si el estado actual es un estado final, False en caso contrario 
+    
+    def minimizar(self): # Método que retorna un nuevo AFD mínimo que acepta el mismo lenguaje
+        compilado = self.compilar()
+        ancho = compilado.num_simbolos
+        tabla = compilado.tabla
+        minimo = AFD()
+        if compilado.inicial == compilado.fila_muerta: # Sin estado inicial el AFD mínimo queda vacío
+            return minimo
+        simbolos = range(len(compilado.alfabeto)) # Columnas reales, sin la de símbolos desconocidos
+        muerto = compilado.muerto
+        # Elimina los estados inalcanzables desde el estado inicial (el estado muerto se conserva para completar el AFD)
+        alcanzables = [compilado.inicial // ancho, muerto]
+        visitados = bytearray(muerto + 1)
+        visitados[alcanzables[0]] = visitados[muerto] = 1
+        for estado in alcanzables: # Recorrido en anchura; la lista crece mientras se recorre
+            fila = estado * ancho
+            for simbolo in simbolos:
+                destino = tabla[fila + simbolo] // ancho
+                if not visitados[destino]:
+                    visitados[destino] = 1
+                    alcanzables.append(destino)
+        # Transiciones inversas: predecesores[simbolo][estado] = estados que llegan a estado con simbolo
+        predecesores = [{} for _ in simbolos]
+        for estado in alcanzables:
+            fila = estado * ancho
+            for simbolo in simbolos:
+                predecesores[simbolo].setdefault(tabla[fila + simbolo] // ancho, []).append(estado)
+        # Partición inicial: estados finales y no finales
+        finales = [estado for estado in alcanzables if compilado.finales[estado]]
+        no_finales = [estado for estado in alcanzables if not compilado.finales[estado]] # Incluye al estado muerto
+        bloques = [set(bloque) for bloque in (finales, no_finales) if bloque]
+        bloque_de = {}
+        for i, bloque in enumerate(bloques):
+            for estado in bloque:
+                bloque_de[estado] = i
+        # Algoritmo de Hopcroft: refina la partición usando como divisores los bloques pendientes
+        menor = min(range(len(bloques)), key=lambda i: len(bloques[i]))
+        pendientes = {(menor, simbolo) for simbolo in simbolos}
+        while pendientes:
+            divisor, simbolo = pendientes.pop()
+            entrantes = predecesores[simbolo]
+            afectados = {} # Bloque -> estados del bloque que llegan al divisor con el símbolo
+            for estado in bloques[divisor]:
+                for origen in entrantes.get(estado, ()):
+                    afectados.setdefault(bloque_de[origen], set()).add(origen)
+            for i, interseccion in afectados.items():
+                if len(interseccion) == len(bloques[i]): # El bloque completo llega al divisor, no se divide
+                    continue
+                bloques[i] -= interseccion # Divide el bloque en dos
+                nuevo = len(bloques)
+                bloques.append(interseccion)
+                for estado in interseccion:
+                    bloque_de[estado] = nuevo
+                for otro_simbolo in simbolos: # Actualiza los divisores pendientes
+                    if (i, otro_simbolo) in pendientes:
+                        pendientes.add((nuevo, otro_simbolo))
+                    elif len(interseccion) <= len(bloques[i]):
+                        pendientes.add((nuevo, otro_simbolo))
+                    else:
+                        pendientes.add((i, otro_simbolo))
+        # Construye el AFD mínimo: cada bloque se nombra con su estado de menor nombre y el bloque del estado muerto se descarta
+        bloque_muerto = bloque_de[muerto]
+        nombres = {i: compilado.estados[min(bloque)] for i, bloque in enumerate(bloques) if i != bloque_muerto}
+        for i, nombre in nombres.items():
+            fila = min(bloques[i]) * ancho # Todos los estados del bloque tienen transiciones equivalentes
+            for simbolo in simbolos:
+                destino = bloque_de[tabla[fila + simbolo] // ancho]
+                if destino != bloque_muerto:
+                    minimo.agregar_transicion(nombre, compilado.alfabeto[simbolo], nombres[destino])
+        inicial = bloque_de[compilado.inicial // ancho]
+        if inicial == bloque_muerto: # El lenguaje es vacío: queda solo el estado inicial sin transiciones
+            minimo.todos_los_estados.add(compilado.estados[compilado.inicial // ancho])
+            minimo.configurar_estado_inicial(compilado.estados[compilado.inicial // ancho])
+            return minimo
+        minimo.todos_los_estados.add(nombres[inicial]) # El estado inicial puede no tener transiciones
+        minimo.configurar_estado_inicial(nombres[inicial])
+        for i, nombre in nombres.items():
+            if compilado.finales[min(bloques[i])]:
+                minimo.agregar_estado_final(nombre)
+        return minimo
+
+    def equivalente(self, otro): # Método que indica si este AFD y otro aceptan el mismo lenguaje (algoritmo de Hopcroft-Karp con unión-búsqueda)
+        uno, dos = self.compilar(), otro.compilar()
+        desplazamiento = uno.muerto + 1 # Los estados del segundo AFD se numeran después de los del primero
+        padre = list(range(desplazamiento + dos.muerto + 1))
+
+        def raiz(estado): # Busca el representante de la clase del estado comprimiendo el camino
+            while padre[estado] != estado:
+                padre[estado] = padre[padre[estado]]
+                estado = padre[estado]
+            return estado
+
+        alfabeto = list(dict.fromkeys(chain(uno.alfabeto, dos.alfabeto))) # Símbolos de ambos AFD, sin ordenar para admitir tipos distintos
+        # Columnas de cada símbolo en cada tabla; los símbolos que faltan en un AFD llevan a su estado muerto
+        columnas = [(uno.id_simbolo.get(simbolo, uno.desconocido), dos.id_simbolo.get(simbolo, dos.desconocido)) for simbolo in alfabeto]
+        pendientes = [(uno.inicial, dos.inicial)]
+        padre[uno.inicial // uno.num_simbolos] = desplazamiento + dos.inicial // dos.num_simbolos
+        while pendientes:
+            fila_uno, fila_dos = pendientes.pop()
+            if uno.es_final(fila_uno) != dos.es_final(fila_dos): # Un estado acepta y el otro no
+                return False
+            for columna_uno, columna_dos in columnas:
+                destino_uno = uno.tabla[fila_uno + columna_uno]
+                destino_dos = dos.tabla[fila_dos + columna_dos]
+                raiz_uno = raiz(destino_uno // uno.num_simbolos)
+                raiz_dos = raiz(desplazamiento + destino_dos // dos.num_simbolos)
+                if raiz_uno != raiz_dos: # Une las clases y revisa el nuevo par más tarde
+                    padre[raiz_uno] = raiz_dos
+                    pendientes.append((destino_uno, destino_dos))
+        return True
+
+    def agregar_transiciones(self, transiciones): # Método para agregar muchas transiciones en una sola operación
+        existentes = self.transiciones
+        nuevas = {} # Transiciones agrupadas por estado origen, se validan todas antes de modificar el AFD
+        for estado_origen, simbolo, estado_destino in transiciones:
+            trans = nuevas.get(estado_origen)
+            if trans is None:
+                trans = nuevas[estado_origen] = {}
+            if simbolo in trans or (estado_origen in existentes and simbolo in existentes[estado_origen]): # Verifica si ya existe una transición con el mismo símbolo
+                raise ValueError(f"Transición no determinista detectada: desde {estado_origen} ya existe una transición con el símbolo {simbolo}.")
+            trans[simbolo] = estado_destino
+        entrantes = self._entrantes # Referencias locales para acelerar el ciclo
+        grado_entrada = self._grado_entrada
+        for estado_origen, trans in nuevas.items(): # Agrega las transiciones validadas
+            if estado_origen in existentes:
+                existentes[estado_origen].update(trans)
+            else:
+                existentes[estado_origen] = trans
+            for estado_destino in trans.values(): # Actualiza el índice de transiciones entrantes
+                origenes = entrantes.get(estado_destino)
+                if origenes is None:
+                    origenes = entrantes[estado_destino] = {}
+                origenes[estado_origen] = origenes.get(estado_origen, 0) + 1
+                grado_entrada[estado_destino] = grado_entrada.get(estado_destino, 0) + 1
+        self.todos_los_estados.update(nuevas) # Agrega los estados origen
+        self.todos_los_estados.update(grado_entrada) # Agrega los estados destino (todo estado con transiciones entrantes)
+        self._invalidar('agregar_transiciones') # Invalida la tabla compilada una sola vez
+
+    def lista_transiciones(self): # Método que retorna todas las transiciones como tuplas (origen, símbolo, destino)
+        return [(estado_origen, simbolo, estado_destino) for estado_origen, trans in self.transiciones.items() for simbolo, estado_destino in trans.items()]
+
+    def copiar(self): # Método que retorna una copia independiente del AFD
+        return AFD._desde_datos(self.todos_los_estados, self.lista_transiciones(), self.estado_inicial, self.estados_finales)
+
+    @classmethod
+    def _desde_datos(cls, estados, transiciones, estado_inicial, estados_finales): # Método que construye un AFD completo en una sola operación
+        afd = cls()
+        afd.agregar_transiciones(transiciones)
+        afd.todos_los_estados.update(estados) # Conserva los estados que no tienen transiciones
+        if estado_inicial is not None:
+            afd.configurar_estado_inicial(estado_inicial)
+        for estado in estados_finales:
+            afd.agregar_estado_final(estado)
+        return afd
+
+    def guardar_json(self, ruta): # Método que guarda el AFD como JSON con una lista de transiciones
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            json.dump({
+                'estados': sorted(self.todos_los_estados, key=repr), # key=repr ordena también nombres de tipos distintos
+                'estado_inicial': self.estado_inicial,
+                'estados_finales': sorted(self.estados_finales, key=repr),
+                'transiciones': self.lista_transiciones()
+            }, archivo, ensure_ascii=False)
+
+    @classmethod
+    def cargar_json(cls, ruta): # Método que crea un AFD a partir de un archivo JSON guardado con guardar_json
+        with open(ruta, encoding='utf-8') as archivo:
+            datos = json.load(archivo)
+        if not isinstance(datos, dict) or not isinstance(datos.get('transiciones'), list):
+            raise ValueError("El archivo JSON no contiene un AFD: falta la lista de transiciones.")
+        estados, estados_finales = datos.get('estados', []), datos.get('estados_finales', [])
+        if not isinstance(estados, list) or not isinstance(estados_finales, list):
+            raise ValueError("Los estados del archivo JSON deben ser listas.")
+        for transicion in datos['transiciones']:
+            if not isinstance(transicion, list) or len(transicion) != 3:
+                raise ValueError(f"Transición inválida en el archivo JSON: {transicion}")
+        for nombre in chain(estados, estados_finales, [datos.get('estado_inicial')], chain.from_iterable(datos['transiciones'])):
+            if isinstance(nombre, (list, dict)): # Los nombres deben poder guardarse en conjuntos y diccionarios
+                raise ValueError(f"Nombre inválido en el archivo JSON: {nombre}")
+        return cls._desde_datos(estados, datos['transiciones'], datos.get('estado_inicial'), estados_finales)
+
+    def guardar_csv(self, ruta): # Método que guarda el AFD como CSV: una fila por transición, estado inicial o estado final
+        with open(ruta, 'w', encoding='utf-8', newline='') as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerows(('estado', estado) for estado in sorted(self.todos_los_estados, key=repr))
+            if self.estado_inicial is not None:
+                escritor.writerow(('inicial', self.estado_inicial))
+            escritor.writerows(('final', estado) for estado in sorted(self.estados_finales, key=repr))
+            escritor.writerows(('transicion',) + transicion for transicion in self.lista_transiciones())
+
+    @classmethod
+    def cargar_csv(cls, ruta): # Método que crea un AFD a partir de un archivo CSV guardado con guardar_csv
+        estados, transiciones, estados_finales = [], [], []
+        estado_inicial = None
+        with open(ruta, encoding='utf-8', newline='') as archivo:
+            for fila in csv.reader(archivo):
+                if not fila: # Ignora las líneas vacías
+                    continue
+                if len(fila) != (4 if fila[0] == 'transicion' else 2): # Cada tipo de fila tiene una cantidad fija de columnas
+                    raise ValueError(f"Cantidad de columnas inválida en el archivo CSV: {fila}")
+                if fila[0] == 'transicion':
+                    transiciones.append(fila[1:4])
+                elif fila[0] == 'estado':
+                    estados.append(fila[1])
+                elif fila[0] == 'inicial':
+                    estado_inicial = fila[1]
+                elif fila[0] == 'final':
+                    estados_finales.append(fila[1])
+                else:
+                    raise ValueError(f"Fila desconocida en el archivo CSV: {fila}")
+        return cls._desde_datos(estados, transiciones, estado_inicial, estados_finales)
+
+    def guardar_binario(self, ruta): # Método que guarda el AFD en formato binario compacto (la tabla compilada)
+        self.compilar().guardar_binario(ruta)
+
+    @classmethod
+    def cargar_binario(cls, ruta): # Método que crea un AFD a partir de un archivo binario
+        # Recorre toda la tabla para reconstruir las transiciones; si solo se necesita verificar cadenas, AFDCompilado.cargar_binario es mucho más rápido.
+        # El archivo se cierra al terminar: el AFD se puede editar y guardar sobre el mismo archivo, y compilar() arma su propia tabla
+        with AFDCompilado.cargar_binario(ruta) as compilado:
+            ancho = compilado.num_simbolos
+            tabla = compilado.tabla
+            transiciones = []
+            for i, estado_origen in enumerate(compilado.estados): # Recupera las transiciones que no van al estado muerto
+                fila = i * ancho
+                for j, simbolo in enumerate(compilado.alfabeto):
+                    destino = tabla[fila + j]
+                    if destino != compilado.fila_muerta:
+                        transiciones.append((estado_origen, simbolo, compilado.estados[destino // ancho]))
+            estado_inicial = None
+            if compilado.inicial != compilado.fila_muerta:
+                estado_inicial = compilado.estados[compilado.inicial // ancho]
+            estados_finales = [estado for i, estado in enumerate(compilado.estados) if compilado.finales[i]]
+            estados = compilado.estados
+        return cls._desde_datos(estados, transiciones, estado_inicial, estados_finales)
+
+    def obtener_datos_visuales(self):
+        # Esta función retorna una estructura de datos con la información necesaria para dibujar el AFD
+        return {
+            'estados': self.todos_los_estados,
+            'transiciones': self.transiciones,
+            'estado_inicial': self.estado_inicial, 
+            'estados_finales': self.estados_finales
+        }
+
+# Definición de la clase AFND
+class _Epsilon:
+    # Marca de las transiciones vacías del AFND: es un objeto único y no un carácter, así 'ε' puede ser un símbolo más de la entrada
+    def __repr__(self):
+        return 'ε'
+
+EPSILON = _Epsilon() # Se compara siempre con `is`
+
+def _bits(conjunto): # Función que genera los IDs de los estados presentes en un conjunto de bits
+    while conjunto:
+        bit = conjunto & -conjunto # Bit menos significativo encendido
+        yield bit.bit_length() - 1
+        conjunto ^= bit
+
+
+class AFNDCompilado:
+    # Representación del AFND con conjuntos de estados como bits de un entero y construcción de subconjuntos bajo demanda
+    def __init__(self, afnd, tamano_cache=4096): # Constructor que compila el AFND recibido
+        # Los IDs se asignan en orden de inserción, igual que en AFDCompilado, para admitir nombres de tipos distintos
+        self.estados = list(dict.fromkeys(chain(afnd.transiciones, (destino for trans in afnd.transiciones.values() for destinos in trans.values() for destino in destinos), afnd.todos_los_estados))) # Lista de estados, la posición de cada estado es su ID (y su bit)
+        self.id_estado = {estado: i for i, estado in enumerate(self.estados)}
+        self.alfabeto = list(dict.fromkeys(simbolo for trans in afnd.transiciones.values() for simbolo in trans if simbolo is not EPSILON)) # Símbolos sin incluir EPSILON
+        self.movimientos = [{} for _ in self.estados] # movimientos[ID][simbolo] = conjunto de bits de los destinos
+        vacias = [0] * len(self.estados) # Destinos de las transiciones vacías de cada estado
+        for origen, trans in afnd.transiciones.items():
+            i = self.id_estado[origen]
+            for simbolo, destinos in trans.items():
+                bits = 0
+                for destino in destinos:
+                    bits |= 1 << self.id_estado[destino]
+                if simbolo is EPSILON:
+                    vacias[i] = bits
+                else:
+                    self.movimientos[i][simbolo] = bits
+        self.clausuras = [] # Clausura vacía de cada estado, calculada una sola vez
+        for i in range(len(self.estados)):
+            clausura = pendientes = 1 << i
+            while pendientes: # Agrega los estados alcanzables por transiciones vacías hasta que no aparezcan nuevos
+                nuevos = 0
+                for j in _bits(pendientes):
+                    nuevos |= vacias[j]
+                pendientes = nuevos & ~clausura
+                clausura |= nuevos
+            self.clausuras.append(clausura)
+        self.finales = 0 # Conjunto de bits de los estados finales
+        for estado in afnd.estados_finales:
+            if estado in self.id_estado:
+                self.finales |= 1 << self.id_estado[estado]
+        self.inicial = 0 # Sin estado inicial se parte del conjunto vacío, que rechaza toda cadena
+        if afnd.estado_inicial in self.id_estado:
+            self.inicial = self.clausuras[self.id_estado[afnd.estado_inicial]]
+        self.tamano_cache = tamano_cache # Cantidad máxima de estados del AFD guardados en la caché
+        self.cache = OrderedDict() # Estados del AFD descubiertos: conjunto de bits -> {símbolo: conjunto siguiente}, en orden de uso
+
+    def clausura(self, conjunto): # Método que retorna la clausura vacía de un conjunto de estados
+        resultado = 0
+        for i in _bits(conjunto):
+            resultado |= self.clausuras[i]
+        return resultado
+
+    def mover(self, conjunto, simbolo): # Método que calcula el conjunto alcanzado con el símbolo, incluyendo transiciones vacías
+        destinos = 0
+        for i in _bits(conjunto):
+            destinos |= self.movimientos[i].get(simbolo, 0)
+        return self.clausura(destinos)
+
+    def siguiente(self, conjunto, simbolo): # Método que retorna la transición del AFD equivalente, usando la caché de estados descubiertos
+        fila = self.cache.get(conjunto)
+        if fila is None: # Estado del AFD nuevo: se agrega a la caché y se descarta el menos usado si no hay espacio
+            fila = self.cache[conjunto] = {}
+            if len(self.cache) > self.tamano_cache:
+                self.cache.popitem(last=False)
+        else:
+            self.cache.move_to_end(conjunto) # Marca el estado como usado recientemente
+        destino = fila.get(simbolo)
+        if destino is None: # Transición aún no calculada
+            destino = fila[simbolo] = self.mover(conjunto, simbolo)
+        return destino
+
+    def aceptar(self, cadena): # Método para verificar si una cadena es aceptada avanzando sobre conjuntos de estados
+        conjunto = self.inicial
+        for simbolo in cadena:
+            conjunto = self.siguiente(conjunto, simbolo)
+            if not conjunto: # El conjunto vacío es el estado muerto
+                return False
+        return bool(conjunto & self.finales) # Acepta si algún estado alcanzado es final
+
+    def nombre(self, conjunto): # Método que describe el conjunto de estados, por ejemplo '{q0,q2}'; solo para mostrarlo, dos conjuntos pueden dar el mismo texto
+        return '{' + ','.join(str(self.estados[i]) for i in _bits(conjunto)) + '}'
+
+
+class AFND:
+    def __init__(self): # Constructor de la clase AFND
+        self.estado_inicial = None # Inicializa el estado inicial en None
+        self.estados_finales = set() # Inicializa el conjunto de estados finales como un conjunto vacío
+        self.transiciones = {} # Diccionario de transiciones: estado -> {símbolo: conjunto de estados destino}
+        self.todos_los_estados = set() # Inicializa el conjunto de todos los estados como un conjunto vacío
+        self._compilado = None # Representación compilada en caché, se invalida con cada modificación del AFND
+
+    def _invalidar(self): # Método para descartar la representación compilada después de una modificación
+        self._compilado = None
+
+    def compilar(self): # Método que retorna la representación compilada del AFND, construyéndola solo si no está en caché
+        if self._compilado is None:
+            self._compilado = AFNDCompilado(self)
+        return self._compilado
+
+    def configurar_estado_inicial(self, estado): # Método para configurar el estado inicial
+        if estado in self.todos_los_estados:
+            self.estado_inicial = estado
+            self._invalidar()
+        else:
+            raise ValueError("El estado inicial debe ser uno de los estados definidos en las transiciones.")
+
+    def agregar_transicion(self, estado_origen, simbolo, estado_destino): # Método para agregar una transición; se admiten varios destinos por símbolo y transiciones con EPSILON
+        self.transiciones.setdefault(estado_origen, {}).setdefault(simbolo, set()).add(estado_destino)
+        self.todos_los_estados.update([estado_origen, estado_destino])
+        self._invalidar()
+
+    def eliminar_transicion(self, estado_origen, simbolo, estado_destino): # Método para eliminar una transición
+        destinos = self.transiciones.get(estado_origen, {}).get(simbolo)
+        if destinos and estado_destino in destinos:
+            destinos.discard(estado_destino)
+            if not destinos: # No quedan destinos con ese símbolo
+                del self.transiciones[estado_origen][simbolo]
+                if not self.transiciones[estado_origen]: # El estado origen no tiene más transiciones
+                    del self.transiciones[estado_origen]
+            self._invalidar()
+
+    def agregar_estado_final(self, estado): # Método para agregar un estado final
+        if estado in self.todos_los_estados:
+            self.estados_finales.add(estado)
+            self._invalidar()
+        else:
+            raise ValueError("Los estados finales deben ser uno de los estados definidos en las transiciones.")
+
+    def limpiar_estados_finales(self): # Método para quitar todos los estados finales
+        self.estados_finales.clear()
+        self._invalidar()
+
+    def aceptar(self, cadena): # Método para verificar si una cadena es aceptada por el AFND
+        return self.compilar().aceptar(cadena)
+
+    def determinizar(self): # Método que retorna un AFD equivalente construido con el método de los subconjuntos
+        # Cada conjunto de estados se identifica por su entero de bits y recibe un ID en orden de descubrimiento; el estado del AFD se llama q<ID>
+        compilado = self.compilar()
+        afd = AFD()
+        if not compilado.inicial: # Sin estado inicial el AFD queda vacío
+            return afd
+        transiciones = []
+        pendientes = [compilado.inicial]
+        ids = {compilado.inicial: 0} # Conjunto de bits -> ID del estado del AFD
+        for conjunto in pendientes: # Recorrido en anchura; la lista crece mientras se recorre
+            for simbolo in compilado.alfabeto:
+                destino = compilado.mover(conjunto, simbolo)
+                if not destino: # El conjunto vacío es el estado muerto y no se agrega
+                    continue
+                if destino not in ids:
+                    ids[destino] = len(ids)
+                    pendientes.append(destino)
+                transiciones.append((f'q{ids[conjunto]}', simbolo, f'q{ids[destino]}'))
+        afd.agregar_transiciones(transiciones)
+        afd.todos_los_estados.add('q0') # El estado inicial puede no tener transiciones
+        afd.configurar_estado_inicial('q0')
+        for conjunto, identificador in ids.items():
+            if conjunto & compilado.finales:
+                afd.agregar_estado_final(f'q{identificador}')
+        return afd
\ No newline at end of file
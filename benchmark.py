@@ -0,0 +1,247 @@
+# Banco de pruebas de rendimiento del AFD: genera autómatas y cadenas, mide y guarda los resultados en JSON
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from automatas import AFD
+
+LIMITE_TRANSICIONES = 5_000_000 # Las combinaciones con más transiciones se omiten salvo que se indique otro límite
+
+
+# Generadores de autómatas: todos retornan un AFD con estados 'q0'..'q{n-1}' y símbolos tomados de alfabeto()
+def alfabeto(cantidad): # Función que retorna una lista de `cantidad` símbolos de un carácter
+    return [chr(48 + i) if i < 75 else chr(256 + i) for i in range(cantidad)] # Caracteres imprimibles desde '0' y luego fuera de latin-1
+
+def automata_aleatorio(estados, simbolos, generador, densidad=1.0): # AFD con destinos al azar; con densidad < 1 faltan transiciones y hay rechazos anticipados
+    sigma = alfabeto(simbolos)
+    transiciones = [(f'q{i}', simbolo, f'q{generador.randrange(estados)}') for i in range(estados) for simbolo in sigma if densidad >= 1 or generador.random() < densidad]
+    finales = [f'q{i}' for i in range(estados) if generador.random() < 0.5]
+    return _construir(estados, transiciones, finales)
+
+def automata_permutacion(estados, simbolos, generador): # AFD completo donde cada símbolo permuta los estados: ninguna cadena muere y los accesos a la tabla saltan por toda la memoria
+    transiciones = []
+    for simbolo in alfabeto(simbolos):
+        destinos = list(range(estados))
+        generador.shuffle(destinos)
+        transiciones.extend((f'q{i}', simbolo, f'q{destino}') for i, destino in enumerate(destinos))
+    finales = [f'q{i}' for i in range(estados) if generador.random() < 0.5]
+    return _construir(estados, transiciones, finales)
+
+def automata_cadena(estados, simbolos, generador): # AFD en cadena q0 -> q1 -> ... con todos los símbolos y solo el último estado final: peor caso para minimizar (ningún estado es equivalente)
+    transiciones = [(f'q{i}', simbolo, f'q{min(i + 1, estados - 1)}') for i in range(estados) for simbolo in alfabeto(simbolos)]
+    return _construir(estados, transiciones, [f'q{estados - 1}'])
+
+def _construir(estados, transiciones, finales): # Función que arma el AFD en una sola operación
+    afd = AFD()
+    afd.agregar_transiciones(transiciones)
+    afd.todos_los_estados.update(f'q{i}' for i in range(estados)) # Con densidad baja algunos estados pueden no tener transiciones
+    afd.configurar_estado_inicial('q0')
+    for estado in finales:
+        afd.agregar_estado_final(estado)
+    return afd
+
+GENERADORES = {
+    'aleatorio': automata_aleatorio,
+    'disperso': lambda estados, simbolos, generador: automata_aleatorio(estados, simbolos, generador, densidad=0.9),
+    'permutacion': automata_permutacion,
+    'cadena': automata_cadena
+}
+
+
+def corpus(simbolos, cantidad, largo, generador): # Función que genera `cantidad` cadenas al azar de largo `largo`
+    sigma = alfabeto(simbolos)
+    return [''.join(generador.choices(sigma, k=largo)) for _ in range(cantidad)]
+
+
+# Mediciones
+def percentiles(muestras): # Función que retorna los percentiles 50, 90 y 99 de una lista de tiempos, en microsegundos
+    ordenadas = sorted(muestras)
+    if not ordenadas:
+        return {}
+    return {f'p{p}_us': ordenadas[min(len(ordenadas) - 1, len(ordenadas) * p // 100)] * 1e6 for p in (50, 90, 99)}
+
+def memoria_pico(funcion): # Función que ejecuta `funcion` una vez y retorna el pico de memoria reservada, en bytes
+    gc.collect()
+    tracemalloc.start()
+    try:
+        funcion()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def medir_latencias(operaciones): # Función que ejecuta cada operación y retorna el tiempo de cada una
+    reloj = time.perf_counter
+    tiempos = []
+    for operacion in operaciones:
+        inicio = reloj()
+        operacion()
+        tiempos.append(reloj() - inicio)
+    return tiempos
+
+
+def medir(generador_nombre, estados, simbolos, opciones): # Función que corre todas las mediciones para un autómata y retorna sus resultados
+    semilla = f"{opciones.semilla}-{generador_nombre}-{estados}-{simbolos}"
+    generador = random.Random(semilla) # Misma semilla, mismos datos en cada corrida
+    resultado = {'generador': generador_nombre, 'estados': estados, 'simbolos': simbolos}
+
+    # agregar_transicion: latencia de cada inserción al construir un AFD (se limita la cantidad para autómatas grandes)
+    crear = GENERADORES[generador_nombre]
+    inicio = time.perf_counter()
+    afd = crear(estados, simbolos, generador)
+    resultado['construir_s'] = time.perf_counter() - inicio
+    transiciones = afd.lista_transiciones()
+    muestra = generador.sample(transiciones, min(len(transiciones), opciones.muestras))
+    nuevo = AFD()
+    resultado['agregar_transicion'] = percentiles(medir_latencias(lambda t=t: nuevo.agregar_transicion(*t) for t in muestra))
+
+    # compilar: tiempo y memoria de construir la tabla plana
+    inicio = time.perf_counter()
+    afd.compilar()
+    resultado['compilar_s'] = time.perf_counter() - inicio
+    afd._compilado = None
+    resultado['compilar_memoria_pico_bytes'] = memoria_pico(afd.compilar)
+
+    # Instrumentación: cuántos símbolos se leen realmente (los rechazos anticipados dejan el resto de la cadena sin leer)
+    cadenas = corpus(simbolos, opciones.cadenas, opciones.largo, generador)
+    contadores = afd.activar_instrumentacion()
+    for cadena in cadenas:
+        afd.aceptar(cadena)
+    resultado['instrumentacion'] = contadores.resumen()
+    afd.desactivar_instrumentacion()
+    pasos = contadores.pasos # Los tres métodos de abajo se detienen en el mismo símbolo, así que leen los mismos símbolos
+    resultado['simbolos_de_entrada'] = sum(len(cadena) for cadena in cadenas)
+    resultado['rechazo_anticipado'] = contadores.rechazos_anticipados / len(cadenas) if cadenas else 0.0 # Fracción de cadenas que llegaron al estado muerto
+
+    # aceptar: pasos (símbolos leídos) por segundo y latencia por cadena, con la tabla compilada y con los diccionarios.
+    # Con muchos rechazos anticipados cada cadena lee pocos símbolos y domina el costo fijo de cada llamada
+    for nombre, verificar in (('aceptar', afd.aceptar), ('aceptar_sin_compilar', afd.aceptar_sin_compilar)):
+        mejor = float('inf')
+        latencias = []
+        for _ in range(opciones.repeticiones): # Se queda con la mejor de varias repeticiones
+            latencias = medir_latencias(lambda c=c: verificar(c) for c in cadenas)
+            mejor = min(mejor, sum(latencias))
+        resultado[nombre] = dict(percentiles(latencias), pasos_por_segundo=pasos / mejor if mejor else None)
+    afd.aceptar_lote(cadenas[:1]) # La primera llamada importa numpy; no se cuenta
+    inicio = time.perf_counter()
+    afd.aceptar_lote(cadenas)
+    segundos = time.perf_counter() - inicio
+    resultado['aceptar_lote'] = {'pasos_por_segundo': pasos / segundos if segundos else None, 'memoria_pico_bytes': memoria_pico(lambda: afd.aceptar_lote(cadenas))}
+
+    # eliminar_transicion + eliminar_estado_si_es_huerfano: el patrón que usa la interfaz al borrar una transición
+    muestra = generador.sample(transiciones, min(len(transiciones), opciones.muestras))
+
+    def eliminar(transicion):
+        origen, simbolo, destino = transicion
+        afd.eliminar_transicion(origen, simbolo)
+        afd.eliminar_estado_si_es_huerfano(origen)
+        afd.eliminar_estado_si_es_huerfano(destino)
+
+    resultado['eliminar_transicion'] = percentiles(medir_latencias(lambda t=t: eliminar(t) for t in muestra))
+
+    # minimizar: solo hasta el tamaño indicado, porque recorre todo el autómata
+    if estados <= opciones.max_estados_minimizar:
+        afd = crear(estados, simbolos, random.Random(semilla)) # Con la misma semilla se reconstruye el AFD medido arriba, antes de eliminar transiciones
+        inicio = time.perf_counter()
+        minimo = afd.minimizar()
+        resultado['minimizar'] = {'segundos': time.perf_counter() - inicio, 'estados_minimos': len(minimo.todos_los_estados)}
+    return resultado
+
+
+def medir_visualizacion(estados, opciones): # Función que mide actualizar_visualizacion si hay una pantalla disponible; retorna None si no la hay
+    try:
+        import tkinter as tk
+        raiz = tk.Tk()
+    except Exception: # Sin tkinter o sin pantalla no se puede medir la interfaz
+        return None
+    import SimuladorDeAutomatas as interfaz
+    try:
+        interfaz.canvas = tk.Canvas(raiz, width=800, height=800)
+        interfaz.canvas.pack()
+        raiz.update()
+        interfaz.afd = automata_aleatorio(estados, 2, random.Random(opciones.semilla))
+        interfaz.reiniciar_lienzo()
+        inicio = time.perf_counter()
+        interfaz.actualizar_visualizacion() # Primera visualización: disposición y dibujo de lo visible
+        completa = time.perf_counter() - inicio
+        origenes = sorted(interfaz.afd.transiciones)[:opciones.muestras]
+
+        def editar(origen):
+            interfaz.afd.agregar_transicion(origen, 'z', origen) # Bucle nuevo con un símbolo que no existe en el AFD
+            interfaz.sincronizar_arista(origen, origen)
+
+        latencias = medir_latencias(lambda origen=origen: editar(origen) for origen in origenes)
+        return {'estados': estados, 'actualizar_visualizacion_s': completa, 'edicion': percentiles(latencias)}
+    finally:
+        raiz.destroy()
+
+
+def comparar(anterior, actual): # Función que imprime la razón entre los pasos por segundo de dos corridas
+    previos = {(r['generador'], r['estados'], r['simbolos']): r for r in anterior['resultados']}
+    for resultado in actual['resultados']:
+        previo = previos.get((resultado['generador'], resultado['estados'], resultado['simbolos']))
+        if previo is None:
+            continue
+        razones = []
+        for medida in ('aceptar', 'aceptar_sin_compilar', 'aceptar_lote'):
+            antes, ahora = previo[medida].get('pasos_por_segundo'), resultado[medida].get('pasos_por_segundo') # Las corridas anteriores a pasos_por_segundo no se comparan
+            if antes and ahora:
+                razones.append(f"{medida} x{ahora / antes:.2f}")
+        print(f"{resultado['generador']:>12} {resultado['estados']:>8} estados {resultado['simbolos']:>4} símbolos: {', '.join(razones)}")
+
+
+def main(argumentos=None): # Función principal del banco de pruebas
+    analizador = argparse.ArgumentParser(description="Mide el rendimiento del AFD sobre autómatas y cadenas generados.")
+    analizador.add_argument('--estados', type=int, nargs='+', default=[10, 1000, 100000], help="cantidades de estados (por defecto 10 1000 100000)")
+    analizador.add_argument('--simbolos', type=int, nargs='+', default=[2, 16, 256], help="tamaños del alfabeto (por defecto 2 16 256)")
+    analizador.add_argument('--generadores', nargs='+', choices=sorted(GENERADORES), default=sorted(GENERADORES), help="tipos de autómata a generar")
+    analizador.add_argument('--cadenas', type=int, default=1000, help="cadenas por corpus (por defecto 1000)")
+    analizador.add_argument('--largo', type=int, default=1000, help="largo de cada cadena (por defecto 1000)")
+    analizador.add_argument('--muestras', type=int, default=1000, help="operaciones medidas para los percentiles de edición (por defecto 1000)")
+    analizador.add_argument('--repeticiones', type=int, default=3, help="repeticiones de cada medición de velocidad (por defecto 3)")
+    analizador.add_argument('--semilla', type=int, default=0, help="semilla de los generadores (por defecto 0)")
+    analizador.add_argument('--max-transiciones', type=int, default=LIMITE_TRANSICIONES, help="omite las combinaciones con más transiciones")
+    analizador.add_argument('--max-estados-minimizar', type=int, default=100000, help="mide minimizar solo hasta esta cantidad de estados")
+    analizador.add_argument('--visualizacion', action='store_true', help="mide también actualizar_visualizacion (requiere pantalla)")
+    analizador.add_argument('-o', '--salida', help="archivo JSON donde guardar los resultados")
+    analizador.add_argument('--comparar', help="archivo JSON de una corrida anterior para comparar")
+    opciones = analizador.parse_args(argumentos)
+
+    corrida = {
+        'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'plataforma': platform.platform(),
+        'opciones': vars(opciones),
+        'resultados': [],
+        'omitidos': []
+    }
+    for generador_nombre in opciones.generadores:
+        for estados in opciones.estados:
+            for simbolos in opciones.simbolos:
+                if estados * simbolos > opciones.max_transiciones:
+                    corrida['omitidos'].append({'generador': generador_nombre, 'estados': estados, 'simbolos': simbolos})
+                    continue
+                resultado = medir(generador_nombre, estados, simbolos, opciones)
+                corrida['resultados'].append(resultado)
+                print(f"{generador_nombre:>12} {estados:>8} estados {simbolos:>4} símbolos: "
+                      f"aceptar {resultado['aceptar']['pasos_por_segundo'] or 0:,.0f} pasos/s, "
+                      f"sin compilar {resultado['aceptar_sin_compilar']['pasos_por_segundo'] or 0:,.0f} pasos/s, "
+                      f"rechazo anticipado {resultado['rechazo_anticipado']:.0%}, "
+                      f"agregar_transicion p99 {resultado['agregar_transicion'].get('p99_us', 0):.1f} us")
+    if opciones.visualizacion:
+        corrida['visualizacion'] = [medida for medida in (medir_visualizacion(estados, opciones) for estados in opciones.estados) if medida is not None]
+    if opciones.salida:
+        with open(opciones.salida, 'w', encoding='utf-8') as archivo:
+            json.dump(corrida, archivo, indent=2, ensure_ascii=False)
+    if opciones.comparar:
+        with open(opciones.comparar, encoding='utf-8') as archivo:
+            comparar(json.load(archivo), corrida)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
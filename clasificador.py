@@ -0,0 +1,112 @@
+# Clasificador por línea de comandos: verifica cada línea de un archivo con un AFD usando varios procesos
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from automatas import AFD, AFDCompilado
+
+_compilado = None # Tabla compilada del AFD, se carga una sola vez por proceso
+
+
+def cargar_automata(ruta=None, expresion=None): # Función que carga el AFD desde un archivo (.json, .csv o binario) o lo compila desde una expresión regular
+    if expresion is not None:
+        from expresiones_regulares import compilar_expresion # Solo se importa si se usa una expresión
+        return compilar_expresion(expresion)
+    if ruta.endswith('.json'):
+        return AFD.cargar_json(ruta)
+    if ruta.endswith('.csv'):
+        return AFD.cargar_csv(ruta)
+    return AFD.cargar_binario(ruta)
+
+
+def cargar_tabla(ruta=None, expresion=None): # Función que retorna la tabla compilada del AFD
+    if expresion is None and not ruta.endswith(('.json', '.csv')): # El formato binario se mapea en memoria sin reconstruir el AFD y los procesos comparten las páginas del archivo
+        return AFDCompilado.cargar_binario(ruta)
+    return cargar_automata(ruta, expresion).compilar()
+
+
+def _iniciar_proceso(ruta, expresion): # Función que se ejecuta una vez al crear cada proceso y deja lista su tabla compilada
+    global _compilado
+    _compilado = cargar_tabla(ruta, expresion)
+
+
+def clasificar_bloque(cadenas): # Función que retorna un byte por cadena: 1 si es aceptada y 0 si no
+    return bytes(bytearray(bool(resultado) for resultado in _compilado.aceptar_lote(cadenas)))
+
+
+def leer_bloques(archivo, tamano_bloque): # Función que lee el archivo en bloques de cadenas, una cadena por línea
+    while True:
+        bloque = [linea.rstrip('\r\n') for linea in islice(archivo, tamano_bloque)]
+        if not bloque:
+            return
+        yield bloque
+
+
+def clasificar(bloques, ruta=None, expresion=None, procesos=1, compilado=None): # Función que clasifica los bloques en orden, usando un grupo de procesos si procesos > 1
+    global _compilado
+    if procesos <= 1: # Sin procesos adicionales se clasifica en el proceso actual, con la tabla recibida si ya estaba cargada
+        _compilado = compilado if compilado is not None else cargar_tabla(ruta, expresion)
+        for bloque in bloques:
+            yield bloque, clasificar_bloque(bloque)
+        return
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_proceso, initargs=(ruta, expresion)) as grupo:
+        pendientes = [] # Bloques enviados cuyo resultado todavía no se entregó, en orden de lectura
+        for bloque in bloques:
+            pendientes.append((bloque, grupo.submit(clasificar_bloque, bloque)))
+            if len(pendientes) >= 2 * procesos: # Limita los bloques en memoria a dos por proceso
+                bloque, futuro = pendientes.pop(0)
+                yield bloque, futuro.result()
+        for bloque, futuro in pendientes:
+            yield bloque, futuro.result()
+
+
+def entero_positivo(texto): # Función que convierte un argumento de la línea de comandos en un entero mayor que cero
+    try:
+        valor = int(texto)
+    except ValueError:
+        valor = 0
+    if valor < 1:
+        raise argparse.ArgumentTypeError(f"se esperaba un entero positivo, se recibió '{texto}'")
+    return valor
+
+
+def main(argumentos=None): # Función principal de la línea de comandos
+    analizador = argparse.ArgumentParser(description="Clasifica cada línea de un archivo como aceptada o rechazada por un AFD.")
+    origen = analizador.add_mutually_exclusive_group(required=True)
+    origen.add_argument('--automata', help="archivo del AFD (.json, .csv o binario .afd)")
+    origen.add_argument('--expresion', help="expresión regular que se compila a un AFD")
+    analizador.add_argument('cadenas', help="archivo con una cadena por línea")
+    analizador.add_argument('-o', '--salida', help="archivo donde escribir cada cadena con su resultado (por defecto no se escribe)")
+    analizador.add_argument('-p', '--procesos', type=entero_positivo, default=1, help="cantidad de procesos (por defecto 1)")
+    analizador.add_argument('-b', '--tamano-bloque', type=entero_positivo, default=10000, help="cadenas por bloque enviado a cada proceso (por defecto 10000)")
+    opciones = analizador.parse_args(argumentos)
+    try: # Carga el AFD una vez en este proceso para informar los errores antes de crear los procesos
+        compilado = cargar_tabla(opciones.automata, opciones.expresion)
+    except (OSError, ValueError, KeyError) as e:
+        analizador.error(str(e))
+
+    total = aceptadas = simbolos = 0
+    inicio = time.perf_counter()
+    salida = open(opciones.salida, 'w', encoding='utf-8') if opciones.salida else None
+    try:
+        with open(opciones.cadenas, encoding='utf-8') as archivo:
+            for bloque, resultados in clasificar(leer_bloques(archivo, opciones.tamano_bloque), opciones.automata, opciones.expresion, opciones.procesos, compilado):
+                total += len(bloque)
+                aceptadas += sum(resultados)
+                simbolos += sum(len(cadena) for cadena in bloque)
+                if salida is not None:
+                    salida.writelines(f"{cadena}\t{'ACEPTADA' if resultado else 'RECHAZADA'}\n" for cadena, resultado in zip(bloque, resultados))
+    finally:
+        if salida is not None:
+            salida.close()
+    segundos = time.perf_counter() - inicio
+    print(f"Cadenas: {total}, aceptadas: {aceptadas}, rechazadas: {total - aceptadas}", file=sys.stderr)
+    if segundos > 0:
+        print(f"Tiempo: {segundos:.3f} s, {total / segundos:,.0f} cadenas/s, {simbolos / segundos:,.0f} símbolos/s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
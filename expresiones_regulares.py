@@ -0,0 +1,200 @@
+# Compilador de expresiones regulares a AFD
+import re
+import time
+from collections import OrderedDict
+
+from automatas import AFD, AFND, EPSILON
+
+# Sintaxis admitida: concatenación, alternativa |, repeticiones * + ?, paréntesis, clases [abc] y [a-z], y escapes con \
+# Todo lo que se acepta significa lo mismo que en el módulo re; lo que re interpreta de otra forma se rechaza con ValueError:
+# repeticiones seguidas (en re '+?' es perezosa y '*+' posesiva), llaves {n,m}, anclas ^ $, el punto y escapes de letras o dígitos (\d, \w, \n...)
+_ESPECIALES = set('|*+?()[]\\.{^$')
+_REPETICIONES = ('*', '+', '?')
+
+
+class _AnalizadorExpresion:
+    # Analizador descendente recursivo que construye un AFND con el método de Thompson mientras lee la expresión
+    def __init__(self, patron): # Constructor que prepara la lectura del patrón
+        self.patron = patron
+        self.posicion = 0
+        self.afnd = AFND()
+        self.siguiente_estado = 0 # Los estados del AFND se numeran con enteros
+
+    def _nuevo_estado(self): # Método que retorna un estado nuevo del AFND
+        estado = self.siguiente_estado
+        self.siguiente_estado += 1
+        self.afnd.todos_los_estados.add(estado)
+        return estado
+
+    def _error(self, mensaje): # Método que lanza un error indicando la posición en el patrón
+        raise ValueError(f"Expresión regular inválida en la posición {self.posicion}: {mensaje}")
+
+    def _mirar(self): # Método que retorna el carácter actual sin avanzar, o None al final del patrón
+        return self.patron[self.posicion] if self.posicion < len(self.patron) else None
+
+    def analizar(self): # Método que analiza todo el patrón y retorna el AFND resultante
+        inicio, fin = self._alternativa()
+        if self.posicion != len(self.patron): # Quedó un ')' sin abrir
+            self._error("paréntesis sin abrir")
+        self.afnd.configurar_estado_inicial(inicio)
+        self.afnd.agregar_estado_final(fin)
+        return self.afnd
+
+    def _alternativa(self): # alternativa := concatenacion ('|' concatenacion)*
+        ramas = [self._concatenacion()]
+        while self._mirar() == '|':
+            self.posicion += 1
+            ramas.append(self._concatenacion())
+        if len(ramas) == 1:
+            return ramas[0]
+        inicio, fin = self._nuevo_estado(), self._nuevo_estado()
+        for inicio_rama, fin_rama in ramas: # Une las ramas con transiciones vacías
+            self.afnd.agregar_transicion(inicio, EPSILON, inicio_rama)
+            self.afnd.agregar_transicion(fin_rama, EPSILON, fin)
+        return inicio, fin
+
+    def _concatenacion(self): # concatenacion := repeticion*
+        inicio = fin = self._nuevo_estado() # La concatenación vacía acepta solo la cadena vacía
+        while self._mirar() not in (None, '|', ')'):
+            inicio_parte, fin_parte = self._repeticion()
+            self.afnd.agregar_transicion(fin, EPSILON, inicio_parte)
+            fin = fin_parte
+        return inicio, fin
+
+    def _repeticion(self): # repeticion := atomo ('*' | '+' | '?')?
+        inicio, fin = self._atomo()
+        if self._mirar() in _REPETICIONES:
+            operador = self.patron[self.posicion]
+            self.posicion += 1
+            if self._mirar() in _REPETICIONES: # En re serían repeticiones perezosas o posesivas, no anidadas
+                self._error(f"no se admiten repeticiones seguidas '{operador}{self._mirar()}'")
+            nuevo_inicio, nuevo_fin = self._nuevo_estado(), self._nuevo_estado()
+            self.afnd.agregar_transicion(nuevo_inicio, EPSILON, inicio)
+            self.afnd.agregar_transicion(fin, EPSILON, nuevo_fin)
+            if operador in ('*', '?'): # Permite saltarse el átomo
+                self.afnd.agregar_transicion(nuevo_inicio, EPSILON, nuevo_fin)
+            if operador in ('*', '+'): # Permite repetir el átomo
+                self.afnd.agregar_transicion(fin, EPSILON, inicio)
+            inicio, fin = nuevo_inicio, nuevo_fin
+        return inicio, fin
+
+    def _atomo(self): # atomo := '(' alternativa ')' | '[' clase ']' | '\' carácter | carácter
+        caracter = self._mirar()
+        if caracter == '(':
+            self.posicion += 1
+            inicio, fin = self._alternativa()
+            if self._mirar() != ')':
+                self._error("falta ')'")
+            self.posicion += 1
+            return inicio, fin
+        if caracter == '[':
+            self.posicion += 1
+            simbolos = self._clase()
+        elif caracter == '\\':
+            simbolos = [self._escape()]
+        elif caracter in _ESPECIALES:
+            self._error(f"carácter especial '{caracter}' inesperado")
+        else:
+            self.posicion += 1
+            simbolos = [caracter]
+        inicio, fin = self._nuevo_estado(), self._nuevo_estado()
+        for simbolo in simbolos:
+            self.afnd.agregar_transicion(inicio, simbolo, fin)
+        return inicio, fin
+
+    def _escape(self): # Método que lee un carácter escapado con '\'
+        self.posicion += 1
+        caracter = self._mirar()
+        if caracter is None:
+            self._error("'\\' al final del patrón")
+        if caracter.isalnum(): # En re \d, \w, \n, \1... tienen otro significado
+            self._error(f"no se admite el escape '\\{caracter}'")
+        self.posicion += 1
+        return caracter
+
+    def _clase(self): # Método que lee una clase de caracteres hasta el ']' y retorna sus símbolos
+        if self._mirar() == '^':
+            self._error("no se admiten clases negadas")
+        simbolos = []
+        while self._mirar() != ']':
+            if self._mirar() is None:
+                self._error("falta ']'")
+            desde = self._caracter_de_clase()
+            if self._mirar() == '-' and self.posicion + 1 < len(self.patron) and self.patron[self.posicion + 1] != ']': # Rango de caracteres
+                self.posicion += 1
+                hasta = self._caracter_de_clase()
+                if hasta < desde:
+                    self._error(f"rango inválido {desde}-{hasta}")
+                simbolos.extend(chr(codigo) for codigo in range(ord(desde), ord(hasta) + 1))
+            else:
+                simbolos.append(desde)
+        self.posicion += 1
+        if not simbolos:
+            self._error("clase vacía")
+        return simbolos
+
+    def _caracter_de_clase(self): # Método que lee un carácter dentro de una clase, escapado o no
+        if self._mirar() == '\\':
+            return self._escape()
+        caracter = self._mirar()
+        self.posicion += 1
+        return caracter
+
+
+def _renombrar(afd): # Función que retorna una copia del AFD con los estados nombrados q0, q1, ... en orden de recorrido
+    nombres = {afd.estado_inicial: 'q0'}
+    orden = [afd.estado_inicial]
+    for estado in orden: # Recorrido en anchura desde el estado inicial
+        for simbolo in sorted(afd.transiciones.get(estado, {})):
+            destino = afd.transiciones[estado][simbolo]
+            if destino not in nombres:
+                nombres[destino] = f'q{len(nombres)}'
+                orden.append(destino)
+    return AFD._desde_datos(nombres.values(),
+                            [(nombres[origen], simbolo, nombres[destino]) for origen, simbolo, destino in afd.lista_transiciones()],
+                            'q0', [nombres[estado] for estado in afd.estados_finales])
+
+
+_CACHE_EXPRESIONES = OrderedDict() # Expresiones ya compiladas: patrón -> AFD mínimo, en orden de uso
+TAMANO_CACHE_EXPRESIONES = 256 # Cantidad máxima de expresiones guardadas en la caché
+
+
+def compilar_expresion(patron): # Función que compila una expresión regular a un AFD mínimo (Thompson, subconjuntos y Hopcroft)
+    # El AFD retornado es el mismo objeto guardado en la caché y no debe modificarse; para editarlo se usa una copia (afd.copiar())
+    afd = _CACHE_EXPRESIONES.get(patron)
+    if afd is not None: # La expresión ya fue compilada
+        _CACHE_EXPRESIONES.move_to_end(patron)
+        return afd
+    afd = _renombrar(_AnalizadorExpresion(patron).analizar().determinizar().minimizar())
+    _CACHE_EXPRESIONES[patron] = afd
+    if len(_CACHE_EXPRESIONES) > TAMANO_CACHE_EXPRESIONES: # Descarta la expresión usada hace más tiempo
+        _CACHE_EXPRESIONES.popitem(last=False)
+    return afd
+
+
+def comparar_con_re(patron, cadenas, repeticiones=3): # Función que mide AFD.aceptar contra re.fullmatch sobre el mismo corpus
+    cadenas = list(cadenas)
+    afd = compilar_expresion(patron)
+    expresion = re.compile(patron)
+    esperados = [expresion.fullmatch(cadena) is not None for cadena in cadenas]
+    if [afd.aceptar(cadena) for cadena in cadenas] != esperados: # Ambos deben dar el mismo resultado antes de comparar tiempos
+        raise ValueError(f"El AFD de '{patron}' no coincide con re.fullmatch")
+    tiempos = {}
+    for nombre, verificar in (('afd', afd.aceptar), ('re', expresion.fullmatch)):
+        mejor = float('inf')
+        for _ in range(repeticiones): # Se queda con la mejor de varias repeticiones
+            inicio = time.perf_counter()
+            for cadena in cadenas:
+                verificar(cadena)
+            mejor = min(mejor, time.perf_counter() - inicio)
+        tiempos[nombre] = mejor
+    simbolos = sum(len(cadena) for cadena in cadenas)
+    return {
+        'patron': patron,
+        'cadenas': len(cadenas),
+        'estados': len(afd.todos_los_estados),
+        'segundos_afd': tiempos['afd'],
+        'segundos_re': tiempos['re'],
+        'simbolos_por_segundo_afd': simbolos / tiempos['afd'] if tiempos['afd'] else float('inf'),
+        'simbolos_por_segundo_re': simbolos / tiempos['re'] if tiempos['re'] else float('inf')
+    }
@@ -0,0 +1,479 @@
+# Pruebas del núcleo del simulador (automatas.py)
+import itertools
+import os
+import random
+import struct
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from automatas import AFD, AFDCompilado, AFND, AFNDCompilado, EPSILON
+
+
+def indice_reconstruido(afd): # Función que retorna el índice de transiciones entrantes calculado desde cero
+    copia = AFD()
+    copia.transiciones = afd.transiciones
+    copia._reconstruir_indice()
+    return copia._entrantes, copia._grado_entrada
+
+
+class PruebasIndiceEntrante(unittest.TestCase):
+    # El índice que mantienen las ediciones debe ser siempre igual al que se obtiene reconstruyéndolo
+
+    def verificar_indice(self, afd, paso):
+        entrantes, grado_entrada = indice_reconstruido(afd)
+        self.assertEqual(afd._entrantes, entrantes, f"_entrantes difiere después de {paso}")
+        self.assertEqual(afd._grado_entrada, grado_entrada, f"_grado_entrada difiere después de {paso}")
+
+    def test_ediciones_aleatorias(self):
+        for semilla in range(20):
+            generador = random.Random(semilla)
+            estados = [f'q{i}' for i in range(generador.randint(2, 8))]
+            simbolos = ['a', 'b', 'c']
+            afd = AFD()
+            for _ in range(300):
+                operacion = generador.choice(['agregar_transicion', 'agregar_transiciones', 'eliminar_transicion', 'eliminar_estado_si_es_huerfano', 'eliminar_estado'])
+                estado = generador.choice(estados)
+                if operacion == 'agregar_transicion':
+                    simbolo = generador.choice(simbolos)
+                    if simbolo not in afd.transiciones.get(estado, {}):
+                        afd.agregar_transicion(estado, simbolo, generador.choice(estados))
+                elif operacion == 'agregar_transiciones':
+                    nuevas = {(origen, simbolo): generador.choice(estados) for origen, simbolo in ((generador.choice(estados), generador.choice(simbolos)) for _ in range(5))
+                              if simbolo not in afd.transiciones.get(origen, {})}
+                    afd.agregar_transiciones([(origen, simbolo, destino) for (origen, simbolo), destino in nuevas.items()])
+                elif operacion == 'eliminar_transicion':
+                    afd.eliminar_transicion(estado, generador.choice(simbolos))
+                elif operacion == 'eliminar_estado_si_es_huerfano':
+                    afd.eliminar_estado_si_es_huerfano(estado)
+                else:
+                    afd.eliminar_estado(estado)
+                    self.assertNotIn(estado, afd.todos_los_estados)
+                self.verificar_indice(afd, f"{operacion}({estado}) con semilla {semilla}")
+
+    def test_agregar_transiciones_rechaza_no_deterministas_sin_modificar(self):
+        afd = AFD()
+        afd.agregar_transicion('q0', 'a', 'q1')
+        with self.assertRaises(ValueError):
+            afd.agregar_transiciones([('q1', 'a', 'q0'), ('q0', 'a', 'q0')])
+        self.assertEqual(afd.lista_transiciones(), [('q0', 'a', 'q1')])
+        self.verificar_indice(afd, "agregar_transiciones fallido")
+
+
+
+class PruebasTablaCompilada(unittest.TestCase):
+    # aceptar (tabla compilada) debe dar siempre el mismo resultado que aceptar_sin_compilar (diccionarios)
+
+    def afd_aleatorio(self, generador, estados, simbolos):
+        afd = AFD()
+        afd.agregar_transiciones([(origen, simbolo, generador.choice(estados)) for origen in estados for simbolo in simbolos if generador.random() < 0.9])
+        afd.todos_los_estados.update(estados)
+        afd.configurar_estado_inicial(estados[0])
+        for estado in estados:
+            if generador.random() < 0.5:
+                afd.agregar_estado_final(estado)
+        return afd
+
+    def verificar_equivalencia(self, afd, cadenas):
+        for cadena in cadenas:
+            self.assertEqual(afd.aceptar(cadena), afd.aceptar_sin_compilar(cadena), f"resultado distinto para {cadena!r}")
+
+    def test_alfabetos_chicos_y_grandes(self):
+        for semilla, cantidad in enumerate([1, 2, 5, 255, 256, 300]): # Con 256 o más símbolos no se puede usar str.translate
+            generador = random.Random(semilla)
+            simbolos = [chr(97 + i) if i < 26 else chr(1000 + i) for i in range(cantidad)]
+            afd = self.afd_aleatorio(generador, [f'q{i}' for i in range(6)], simbolos)
+            entrada = simbolos + ['!'] # Incluye un símbolo fuera del alfabeto
+            cadenas = [''.join(generador.choices(entrada, k=generador.choice([0, 1, 3, 63, 64, 65, 500]))) for _ in range(200)]
+            self.verificar_equivalencia(afd, cadenas)
+            self.verificar_equivalencia(afd, [list(cadena) for cadena in cadenas[:20]]) # Entradas que no son str
+
+    def test_aceptar_lote(self):
+        for semilla, cantidad in enumerate([2, 300]):
+            generador = random.Random(semilla)
+            simbolos = [chr(97 + i) if i < 26 else chr(1000 + i) for i in range(cantidad)]
+            afd = self.afd_aleatorio(generador, [f'q{i}' for i in range(6)], simbolos)
+            entrada = simbolos + ['!']
+            cadenas = [''.join(generador.choices(entrada, k=generador.choice([0, 1, 2, 10, 1000]))) for _ in range(300)] # Largos muy distintos dentro del mismo lote
+            esperados = [afd.aceptar_sin_compilar(cadena) for cadena in cadenas]
+            self.assertEqual(afd.aceptar_lote(cadenas), esperados)
+            self.assertEqual(afd.aceptar_lote(cadenas + [simbolos[0] * 20000]), esperados + [afd.aceptar_sin_compilar(simbolos[0] * 20000)]) # Una cadena mucho más larga que el resto
+            with mock.patch.dict(sys.modules, {'numpy': None}): # Sin NumPy el resultado debe ser del mismo tipo
+                self.assertEqual(afd.aceptar_lote(cadenas), esperados)
+        self.assertEqual(afd.aceptar_lote([]), [])
+        self.assertIsInstance(afd.aceptar_lote(['a']), list)
+
+    def test_nombres_de_tipos_distintos(self):
+        afd = AFD()
+        afd.agregar_transicion(0, 'a', 'fin')
+        afd.agregar_transicion('fin', 1, 0)
+        afd.configurar_estado_inicial(0)
+        afd.agregar_estado_final('fin')
+        self.verificar_equivalencia(afd, ['a', '', 'aa', ['a', 1, 'a'], ['a', 1], ('a', 2)])
+        self.assertTrue(afd.aceptar('a'))
+
+    def test_rechazo_anticipado_en_cadenas_largas(self):
+        generador = random.Random(0)
+        for cantidad in (2, 300):
+            simbolos = [chr(97 + i) if i < 26 else chr(1000 + i) for i in range(cantidad)]
+            afd = self.afd_aleatorio(generador, ['q0', 'q1'], simbolos)
+            larga = ''.join(generador.choices(simbolos, k=200000))
+            self.verificar_equivalencia(afd, ['!' + larga, larga, larga + '!'])
+
+
+
+    def test_instrumentacion(self):
+        afd = AFD()
+        afd.agregar_transiciones([('q0', 'a', 'q1'), ('q1', 'b', 'q0')])
+        afd.configurar_estado_inicial('q0')
+        afd.agregar_estado_final('q1')
+        contadores = afd.activar_instrumentacion()
+        resultados = [afd.aceptar(cadena) for cadena in ['aba', 'abb', 'x' + 'ab' * 1000, '']]
+        self.assertEqual(resultados, [True, False, False, False])
+        self.assertEqual((contadores.cadenas, contadores.pasos, contadores.rechazos_anticipados), (4, 3 + 3 + 1, 2))
+        afd.agregar_transicion('q1', 'a', 'q1')
+        self.assertEqual(contadores.ediciones, {'agregar_transicion': 1})
+
+
+def palabras(simbolos, largo_maximo): # Función que genera todas las cadenas de hasta largo_maximo símbolos
+    return [''.join(letras) for largo in range(largo_maximo + 1) for letras in itertools.product(simbolos, repeat=largo)]
+
+
+class PruebasMinimizacion(unittest.TestCase):
+    # minimizar y equivalente se comparan con una verificación por fuerza bruta sobre todas las cadenas cortas
+
+    def afd_aleatorio(self, generador, cantidad_estados, simbolos='ab'):
+        estados = [f'q{i}' for i in range(cantidad_estados)]
+        afd = AFD()
+        afd.agregar_transiciones([(origen, simbolo, generador.choice(estados)) for origen in estados for simbolo in simbolos if generador.random() < 0.8])
+        afd.todos_los_estados.update(estados)
+        afd.configurar_estado_inicial(estados[0])
+        for estado in estados:
+            if generador.random() < 0.4:
+                afd.agregar_estado_final(estado)
+        return afd
+
+    def test_minimizar(self):
+        generador = random.Random(0)
+        for _ in range(300):
+            afd = self.afd_aleatorio(generador, generador.randint(1, 7))
+            minimo = afd.minimizar()
+            for cadena in palabras('ab', 7): # Dos AFD de hasta 8 estados (contando el muerto) que difieren, difieren en una cadena de largo menor a 8
+                self.assertEqual(minimo.aceptar_sin_compilar(cadena), afd.aceptar_sin_compilar(cadena), f"{afd.lista_transiciones()} con {cadena!r}")
+            self.assertLessEqual(len(minimo.todos_los_estados), len(afd.todos_los_estados))
+            self.assertEqual(len(minimo.minimizar().todos_los_estados), len(minimo.todos_los_estados)) # El AFD mínimo ya no se puede reducir
+            self.assertTrue(afd.equivalente(minimo))
+
+    def test_equivalente(self):
+        generador = random.Random(1)
+        for _ in range(500):
+            uno = self.afd_aleatorio(generador, generador.randint(1, 3))
+            dos = self.afd_aleatorio(generador, generador.randint(1, 3))
+            fuerza_bruta = all(uno.aceptar_sin_compilar(cadena) == dos.aceptar_sin_compilar(cadena) for cadena in palabras('ab', 8))
+            self.assertEqual(uno.equivalente(dos), fuerza_bruta, f"{uno.lista_transiciones()} y {dos.lista_transiciones()}")
+            self.assertEqual(dos.equivalente(uno), fuerza_bruta)
+
+    def test_alfabetos_distintos(self):
+        uno = AFD()
+        uno.agregar_transicion('p', 'a', 'p')
+        uno.configurar_estado_inicial('p')
+        uno.agregar_estado_final('p')
+        dos = uno.copiar()
+        dos.agregar_transicion('p', 'b', 'p') # Acepta además las cadenas con 'b'
+        self.assertFalse(uno.equivalente(dos))
+        dos.eliminar_transicion('p', 'b')
+        dos.agregar_transicion('p', 'b', 'r') # 'r' no es final ni tiene salida: equivale a no tener la transición
+        self.assertTrue(uno.equivalente(dos))
+
+
+def clausura_fuerza_bruta(afnd, estados): # Función que calcula la clausura vacía recorriendo los diccionarios del AFND
+    clausura = set(estados)
+    pendientes = list(estados)
+    while pendientes:
+        for destino in afnd.transiciones.get(pendientes.pop(), {}).get(EPSILON, ()):
+            if destino not in clausura:
+                clausura.add(destino)
+                pendientes.append(destino)
+    return clausura
+
+def aceptar_fuerza_bruta(afnd, cadena): # Función que simula el AFND con conjuntos de Python, sin compilarlo
+    if afnd.estado_inicial is None:
+        return False
+    actuales = clausura_fuerza_bruta(afnd, [afnd.estado_inicial])
+    for simbolo in cadena:
+        actuales = clausura_fuerza_bruta(afnd, [destino for estado in actuales for destino in afnd.transiciones.get(estado, {}).get(simbolo, ())])
+    return bool(actuales & afnd.estados_finales)
+
+
+class PruebasAFND(unittest.TestCase):
+    # AFND.aceptar, determinizar().aceptar y una simulación con conjuntos deben coincidir
+
+    def afnd_aleatorio(self, generador, estados, simbolos='ab'):
+        afnd = AFND()
+        for origen in estados:
+            for simbolo in list(simbolos) + [EPSILON]:
+                for destino in estados:
+                    if generador.random() < (0.15 if simbolo is EPSILON else 0.25):
+                        afnd.agregar_transicion(origen, simbolo, destino)
+        afnd.todos_los_estados.update(estados)
+        afnd.configurar_estado_inicial(estados[0])
+        for estado in estados:
+            if generador.random() < 0.3:
+                afnd.agregar_estado_final(estado)
+        return afnd
+
+    def test_aleatorio(self):
+        generador = random.Random(0)
+        cadenas = palabras('ab', 6)
+        for _ in range(150):
+            afnd = self.afnd_aleatorio(generador, [f'p{i}' for i in range(generador.randint(1, 6))])
+            afd = afnd.determinizar()
+            for cadena in cadenas:
+                esperado = aceptar_fuerza_bruta(afnd, cadena)
+                self.assertEqual(afnd.aceptar(cadena), esperado, f"{afnd.transiciones} con {cadena!r}")
+                self.assertEqual(afd.aceptar(cadena), esperado, f"determinizar de {afnd.transiciones} con {cadena!r}")
+
+    def test_clausura(self):
+        generador = random.Random(1)
+        for _ in range(100):
+            afnd = self.afnd_aleatorio(generador, list(range(6)))
+            compilado = afnd.compilar()
+            for estado in range(6):
+                bits = compilado.clausura(1 << compilado.id_estado[estado])
+                self.assertEqual({compilado.estados[i] for i in range(6) if bits >> i & 1}, clausura_fuerza_bruta(afnd, [estado]))
+
+    def test_cache_limitada(self):
+        generador = random.Random(2)
+        afnd = self.afnd_aleatorio(generador, [f'p{i}' for i in range(8)])
+        compilado = AFNDCompilado(afnd, tamano_cache=2) # Obliga a descartar estados del AFD constantemente
+        for cadena in palabras('ab', 6):
+            self.assertEqual(compilado.aceptar(cadena), aceptar_fuerza_bruta(afnd, cadena))
+            self.assertLessEqual(len(compilado.cache), 2)
+
+    def test_epsilon_no_es_el_caracter(self):
+        afnd = AFND()
+        afnd.agregar_transicion('inicio', 'ε', 'fin') # Transición con el carácter 'ε', no vacía
+        afnd.configurar_estado_inicial('inicio')
+        afnd.agregar_estado_final('fin')
+        self.assertFalse(afnd.aceptar(''))
+        self.assertTrue(afnd.aceptar('ε'))
+        self.assertTrue(afnd.determinizar().aceptar('ε'))
+
+    def test_nombres_que_parecen_conjuntos(self):
+        # Con nombres como 'a,b' el texto '{a,b}' no distingue el conjunto {'a,b'} del conjunto {'a', 'b'}
+        afnd = AFND()
+        afnd.agregar_transicion('s', 'x', 'a,b')
+        afnd.agregar_transicion('s', 'y', 'a')
+        afnd.agregar_transicion('s', 'y', 'b')
+        afnd.agregar_transicion('a,b', 'p', 'f')
+        afnd.agregar_transicion('a', 'q', 'f')
+        afnd.configurar_estado_inicial('s')
+        afnd.agregar_estado_final('f')
+        afd = afnd.determinizar()
+        for cadena in ['xp', 'xq', 'yp', 'yq']:
+            self.assertEqual(afd.aceptar(cadena), aceptar_fuerza_bruta(afnd, cadena), cadena)
+
+    def test_nombres_de_tipos_distintos(self):
+        afnd = AFND()
+        afnd.agregar_transicion(0, 'a', 'fin')
+        afnd.agregar_transicion(0, EPSILON, 1)
+        afnd.configurar_estado_inicial(0)
+        afnd.agregar_estado_final('fin')
+        self.assertTrue(afnd.aceptar('a'))
+        self.assertTrue(afnd.determinizar().aceptar('a'))
+
+
+class PruebasReconocedorIncremental(unittest.TestCase):
+    # Leer una cadena por fragmentos o desde un archivo debe dar el mismo resultado que aceptar
+
+    def setUp(self):
+        self.afd = AFD()
+        self.afd.agregar_transiciones([('q0', 'a', 'q1'), ('q1', 'ñ', 'q0'), ('q1', 'a', 'q1'), ('q0', '€', 'q0')]) # Símbolos de 1, 2 y 3 bytes en UTF-8
+        self.afd.configurar_estado_inicial('q0')
+        self.afd.agregar_estado_final('q1')
+
+    def test_fragmentos(self):
+        generador = random.Random(0)
+        for _ in range(200):
+            cadena = ''.join(generador.choices('aañ€x', k=generador.randint(0, 40)))
+            cortes = sorted(generador.sample(range(len(cadena) + 1), min(len(cadena) + 1, 4)))
+            reconocedor = self.afd.reconocedor()
+            for desde, hasta in zip([0] + cortes, cortes + [len(cadena)]):
+                reconocedor.feed(cadena[desde:hasta])
+            self.assertEqual(reconocedor.resultado(), self.afd.aceptar(cadena), repr(cadena))
+            reconocedor.reiniciar()
+            self.assertEqual(reconocedor.feed(cadena).resultado(), self.afd.aceptar(cadena))
+
+    def test_estado_actual_y_muerto(self):
+        reconocedor = self.afd.reconocedor().feed('aa')
+        self.assertEqual(reconocedor.estado_actual(), 'q1')
+        self.assertEqual(reconocedor.simbolos_leidos, 2)
+        reconocedor.feed('x')
+        self.assertTrue(reconocedor.muerto())
+        self.assertIsNone(reconocedor.estado_actual())
+        self.assertFalse(reconocedor.feed('ñ').resultado())
+
+    def test_archivos(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'entrada.txt')
+            generador = random.Random(1)
+            for _ in range(30):
+                cadena = ''.join(generador.choices('aañ€', k=generador.randint(0, 60)))
+                if generador.random() < 0.3:
+                    cadena += 'x' + cadena # Rechazo a mitad del archivo
+                with open(ruta, 'w', encoding='utf-8', newline='') as archivo:
+                    archivo.write(cadena)
+                for tamano_bloque in (1, 2, 3, 7, 1 << 20): # Bloques chicos cortan los caracteres de varios bytes entre dos lecturas
+                    for usar_mmap in (False, True):
+                        with self.subTest(cadena=cadena, tamano_bloque=tamano_bloque, usar_mmap=usar_mmap):
+                            self.assertEqual(self.afd.aceptar_archivo(ruta, tamano_bloque=tamano_bloque, usar_mmap=usar_mmap), self.afd.aceptar(cadena))
+
+
+class PruebasTraza(unittest.TestCase):
+
+    def setUp(self):
+        self.afd = AFD()
+        self.afd.agregar_transiciones([('q0', 'a', 'q1'), ('q1', 'b', 'q0')])
+        self.afd.configurar_estado_inicial('q0')
+        self.afd.agregar_estado_final('q1')
+
+    def test_traza_aceptada(self):
+        traza = self.afd.trazar('aba')
+        self.assertEqual(len(traza), 4)
+        self.assertTrue(traza.aceptada)
+        self.assertEqual([traza.estado(paso) for paso in range(len(traza))], ['q0', 'q1', 'q0', 'q1'])
+        self.assertIsNone(traza.transicion(0))
+        self.assertEqual(traza.transicion(2), ('q1', 'b', 'q0'))
+        self.assertIsNone(traza.paso_de_rechazo())
+
+    def test_traza_rechazada(self):
+        traza = self.afd.trazar('abba')
+        self.assertFalse(traza.aceptada)
+        self.assertEqual(len(traza), 4) # La traza termina al llegar al estado muerto, sin leer el resto
+        self.assertEqual(traza.paso_de_rechazo(), 3)
+        self.assertIsNone(traza.estado(3))
+        self.assertEqual(traza.transicion(3), ('q0', 'b', None))
+        self.assertFalse(self.afd.trazar('ab').aceptada)
+        self.assertEqual(self.afd.trazar('ab').paso_de_rechazo(), None)
+
+    def test_coincide_con_aceptar(self):
+        generador = random.Random(2)
+        for _ in range(200):
+            cadena = ''.join(generador.choices('abx', k=generador.randint(0, 10)))
+            traza = self.afd.trazar(cadena)
+            self.assertEqual(traza.aceptada, self.afd.aceptar(cadena))
+            self.assertEqual(traza.estado(len(traza) - 1), self.afd.reconocedor().feed(cadena).estado_actual())
+
+
+class PruebasFormatoBinario(unittest.TestCase):
+    # Un archivo binario dañado debe producir ValueError, nunca otro tipo de error
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, 'afd.afd')
+        afd = AFD()
+        afd.agregar_transiciones([('q0', 'a', 'q1'), ('q1', 'b', 'q0')])
+        afd.configurar_estado_inicial('q0')
+        afd.agregar_estado_final('q1')
+        afd.guardar_binario(self.ruta)
+        with open(self.ruta, 'rb') as archivo:
+            self.contenido = archivo.read()
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def escribir(self, contenido):
+        with open(self.ruta, 'wb') as archivo:
+            archivo.write(contenido)
+
+    def test_ida_y_vuelta(self):
+        compilado = AFDCompilado.cargar_binario(self.ruta)
+        self.assertTrue(compilado.aceptar('aba'))
+        self.assertFalse(compilado.aceptar('ab'))
+        self.assertEqual(sorted(AFD.cargar_binario(self.ruta).lista_transiciones()), [('q0', 'a', 'q1'), ('q1', 'b', 'q0')])
+
+    def test_archivos_danados(self):
+        tabla_fuera_de_rango = bytearray(self.contenido)
+        tabla_fuera_de_rango[40:48] = struct.pack('<q', 1000) # Primera celda de la tabla, justo después del encabezado
+        tabla_desalineada = bytearray(self.contenido)
+        tabla_desalineada[40:48] = struct.pack('<q', 1) # Dentro de la tabla pero no al inicio de una fila
+        danados = {
+            'vacío': b'',
+            'encabezado corto': self.contenido[:20],
+            'tabla truncada': self.contenido[:45],
+            'nombres truncados': self.contenido[:-3],
+            'magia incorrecta': b'XXXX' + self.contenido[4:],
+            'destino fuera de rango': bytes(tabla_fuera_de_rango),
+            'destino desalineado': bytes(tabla_desalineada)
+        }
+        for nombre, contenido in danados.items():
+            self.escribir(contenido)
+            with self.subTest(nombre):
+                with self.assertRaises(ValueError):
+                    AFDCompilado.cargar_binario(self.ruta)
+                with self.assertRaises(ValueError):
+                    AFD.cargar_binario(self.ruta)
+
+
+    def test_guardar_sobre_el_archivo_cargado(self):
+        afd = AFD.cargar_binario(self.ruta)
+        afd.compilar()
+        afd.guardar_binario(self.ruta) # Antes truncaba el archivo que seguía mapeado
+        with AFDCompilado.cargar_binario(self.ruta) as compilado:
+            self.assertTrue(compilado.aceptar('aba'))
+            compilado.guardar_binario(self.ruta) # También desde la tabla mapeada
+        self.assertEqual(sorted(AFD.cargar_binario(self.ruta).lista_transiciones()), [('q0', 'a', 'q1'), ('q1', 'b', 'q0')])
+        self.assertEqual(os.listdir(self.directorio.name), ['afd.afd']) # No quedan archivos temporales
+
+    def test_cerrar(self):
+        compilado = AFDCompilado.cargar_binario(self.ruta)
+        compilado.cerrar()
+        compilado.cerrar() # Cerrar dos veces no falla
+        with self.assertRaises(ValueError):
+            compilado.aceptar('a')
+
+
+class PruebasFormatosDeTexto(unittest.TestCase):
+    # Los archivos JSON y CSV mal formados deben producir ValueError
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def escribir(self, nombre, contenido):
+        ruta = os.path.join(self.directorio.name, nombre)
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            archivo.write(contenido)
+        return ruta
+
+    def test_json_invalido(self):
+        for contenido in ['[]', '{}', '{"transiciones": 3}', '{"transiciones": [["q0", "a"]]}', '{"transiciones": [["q0", "a", ["q1"]]]}',
+                          '{"transiciones": [], "estados": "q0"}', '{"transiciones": [["q0", "a", "q1"]], "estado_inicial": "q9"}', '{']:
+            with self.subTest(contenido):
+                with self.assertRaises(ValueError):
+                    AFD.cargar_json(self.escribir('afd.json', contenido))
+
+    def test_csv_invalido(self):
+        for contenido in ['estado\n', 'transicion,q0,a\n', 'transicion,q0,a,q1,q2\n', 'inicial\n', 'otra,q0\n', 'transicion,q0,a,q1\ninicial,q9\n']:
+            with self.subTest(contenido):
+                with self.assertRaises(ValueError):
+                    AFD.cargar_csv(self.escribir('afd.csv', contenido))
+
+    def test_nombres_de_tipos_distintos(self):
+        afd = AFD()
+        afd.agregar_transicion(0, 'a', 'fin')
+        afd.configurar_estado_inicial(0)
+        afd.agregar_estado_final('fin')
+        ruta = os.path.join(self.directorio.name, 'afd.json')
+        afd.guardar_json(ruta)
+        self.assertEqual(AFD.cargar_json(ruta).lista_transiciones(), [(0, 'a', 'fin')])
+        ruta = os.path.join(self.directorio.name, 'afd.csv')
+        afd.guardar_csv(ruta) # En CSV todos los nombres vuelven como texto
+        self.assertEqual(AFD.cargar_csv(ruta).lista_transiciones(), [('0', 'a', 'fin')])
+
+
+if __name__ == "__main__":
+    unittest.main()
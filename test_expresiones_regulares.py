@@ -0,0 +1,49 @@
+# Pruebas del compilador de expresiones regulares (expresiones_regulares.py)
+import itertools
+import random
+import re
+import unittest
+import warnings
+
+from expresiones_regulares import compilar_expresion, comparar_con_re
+
+
+class PruebasCompilarExpresion(unittest.TestCase):
+
+    def test_coincide_con_re(self):
+        # Todo patrón aceptado debe reconocer exactamente las mismas cadenas que re.fullmatch
+        generador = random.Random(0)
+        piezas = list('abcε') + ['|', '*', '+', '?', '(', ')', '[', ']', '-', '[a-c]', '\\.', '\\+', '}']
+        cadenas = [''.join(letras) for largo in range(4) for letras in itertools.product('abcε.+}', repeat=largo)]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore') # re advierte sobre algunas clases como '[['
+            for _ in range(2000):
+                patron = ''.join(generador.choices(piezas, k=generador.randint(1, 6)))
+                try:
+                    afd = compilar_expresion(patron)
+                except ValueError:
+                    continue
+                expresion = re.compile(patron)
+                for cadena in cadenas:
+                    self.assertEqual(afd.aceptar(cadena), expresion.fullmatch(cadena) is not None, f"{patron!r} con {cadena!r}")
+
+    def test_rechaza_sintaxis_con_otro_significado_en_re(self):
+        for patron in ['(c)?+', '[a-c]+?', 'a*+', 'a**', 'a{2}', '\\d', 'a$', '^a', 'a.b', '[^a]', '(a', 'a)', '[]']:
+            with self.subTest(patron):
+                with self.assertRaises(ValueError):
+                    compilar_expresion(patron)
+
+    def test_epsilon_es_un_caracter_comun(self):
+        # 'ε' en el patrón es el carácter, no una transición vacía
+        for patron, cadena, esperado in [('ε', '', False), ('ε', 'ε', True), ('aε', 'a', False), ('aε', 'aε', True), ('[aε]', '', False), ('[aε]', 'ε', True)]:
+            self.assertEqual(compilar_expresion(patron).aceptar(cadena), esperado, f"{patron!r} con {cadena!r}")
+            self.assertEqual(re.fullmatch(patron, cadena) is not None, esperado)
+
+    def test_comparar_con_re(self):
+        resultado = comparar_con_re('(a|b)*abb', ['abb', 'aabb', 'ab', ''], repeticiones=1)
+        self.assertEqual(resultado['cadenas'], 4)
+        self.assertEqual(resultado['estados'], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()